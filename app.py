@@ -1,17 +1,45 @@
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
-import sqlite3
 import os
-from datetime import datetime
+
+# When run directly, switch blocking sockets to gevent's cooperative versions.
+# This has to happen before requests/sqlite3 are imported.
+GEVENT_AVAILABLE = False
+if __name__ == '__main__':
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+        GEVENT_AVAILABLE = True
+    except ImportError:
+        pass
+
+from flask import Flask, Response, g, make_response, render_template, request, jsonify, redirect, url_for
+import sqlite3
 import logging
 import requests
-from io import BytesIO
 import json
+import re
 import sys
+import threading
+import queue
+import atexit
+import time
+import itertools
+import collections
+import functools
+import hashlib
+import gzip
+import random
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask.json.provider import DefaultJSONProvider
 from pathlib import Path
 
 # Add the scraper directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'scraper'))
 
+# Standard-library only, so available even when the scraper import below fails
+from scraper.timestamps import ts_for_second, iso_for_second, year_for_second
+
 # Try to import the scraper, if it fails, we'll use a fallback
 try:
     from fetch_wardha_case_data import WardhaDistrictCourtScraper
@@ -20,8 +48,49 @@ except ImportError as e:
     print(f"Warning: Could not import scraper: {e}")
     SCRAPER_AVAILABLE = False
 
+# Prefer orjson for JSON encoding, falling back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def fast_dumps(obj):
+    """Serialize obj to a JSON string, converting unsupported values with str()"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=str)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify()"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Response compression is optional; without Flask-Compress bodies are sent as-is
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-here')
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+# Compress HTML/JSON bodies over 512 bytes, preferring Brotli where the client supports it
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+if COMPRESS_AVAILABLE:
+    Compress(app)
 
 # Configure logging
 logging.basicConfig(
@@ -34,13 +103,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def ttl_cache(seconds):
+    """Cache a view's successful response for `seconds`, tagging responses with X-Cache"""
+    def decorator(view):
+        cache = {'payload': None, 'ts': 0, 'lock': threading.Lock()}
+        
+        def cached_response():
+            body, content_type = cache['payload']
+            response = Response(body, content_type=content_type)
+            response.headers['X-Cache'] = 'HIT'
+            return response
+        
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if cache['payload'] is not None and time.time() - cache['ts'] < seconds:
+                return cached_response()
+            
+            with cache['lock']:
+                # Another request may have refreshed the cache while we were waiting
+                if cache['payload'] is not None and time.time() - cache['ts'] < seconds:
+                    return cached_response()
+                
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200:
+                    cache['payload'] = (response.get_data(), response.content_type)
+                    cache['ts'] = time.time()
+                response.headers['X-Cache'] = 'MISS'
+                return response
+        
+        return wrapper
+    return decorator
+
+DB_PATH = 'db/court_queries.db'
+
+# Interval between background PRAGMA optimize runs (seconds)
+DB_OPTIMIZE_INTERVAL = 15 * 60
+
+def get_conn():
+    """Open a SQLite connection with the per-connection tuning PRAGMAs applied"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, timeout=5)
+    cursor = conn.cursor()
+    
+    # synchronous/busy_timeout/temp_store/cache_size only last for this connection
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-20000')
+    
+    return conn
+
+# Open connections shared by all requests, so the connection setup and SQLite
+# page cache are reused. A thread-local would be per greenlet under gevent and
+# open a fresh connection for every request.
+DB_POOL_SIZE = 8
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+def get_db():
+    """Return the current request's database connection, borrowing one from the pool on first use"""
+    conn = g.get('db')
+    if conn is None:
+        try:
+            conn = _db_pool.get_nowait()
+        except queue.Empty:
+            conn = get_conn()
+        g.db = conn
+    return conn
+
+@app.teardown_appcontext
+def release_db(exception):
+    """Hand the request's connection back to the pool, closing it if the pool is full"""
+    conn = g.pop('db', None)
+    if conn is not None:
+        try:
+            _db_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
 # Database initialization
 def init_db():
     """Initialize the SQLite database"""
     os.makedirs('db', exist_ok=True)
-    conn = sqlite3.connect('db/court_queries.db')
+    conn = get_conn()
     cursor = conn.cursor()
     
+    # WAL is persistent at the database level, so readers of /api/stats and
+    # /dashboard no longer block the query logging writers
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS queries (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -70,15 +219,185 @@ def init_db():
         )
     ''')
     
+    # Indexes for the stats/dashboard aggregations and recent-row listings
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_queries_ts ON queries(query_timestamp DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_queries_status ON queries(status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_queries_case_type ON queries(case_type)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_court_status_checked ON court_status(last_checked DESC)')
+    
+    # Gather planner statistics once; PRAGMA optimize keeps them current afterwards
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute('ANALYZE')
+    
     conn.commit()
     conn.close()
     logger.info("Database initialized successfully")
 
+def optimize_db():
+    """Periodically let SQLite refresh its query planner statistics"""
+    try:
+        conn = get_conn()
+        conn.execute('PRAGMA optimize')
+        conn.close()
+    except Exception as e:
+        logger.error(f"Error optimizing database: {str(e)}")
+    
+    timer = threading.Timer(DB_OPTIMIZE_INTERVAL, optimize_db)
+    timer.daemon = True
+    timer.start()
+
+# Query/court status logging is handed off to a background writer so the
+# request path never waits on an INSERT + commit
+LOG_QUEUE_MAXSIZE = 10000
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.05  # seconds to wait for more rows before committing a batch
+
+# Fraction of successful queries that keep parsed_data while the log queue is backed up
+LOG_PARSED_SAMPLE_RATE = float(os.environ.get('LOG_PARSED_SAMPLE_RATE', '1.0'))
+
+# The INSERT statements are module constants and the writer keeps a single
+# connection for its lifetime: sqlite3 caches prepared statements per
+# connection keyed on the SQL text, so each INSERT is parsed and planned once
+# rather than per row. Keep both true when changing the writer.
+_INSERT_QUERY_SQL = '''
+    INSERT INTO queries 
+    (case_type, case_number, filing_year, raw_response, parsed_data, status, error_message, user_ip, court_name)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_COURT_STATUS_SQL = '''
+    INSERT INTO court_status 
+    (court_name, url, status, response_time, error_details)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_INSERT_SQL = {
+    'queries': _INSERT_QUERY_SQL,
+    'court_status': _INSERT_COURT_STATUS_SQL
+}
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+
+def _write_log_batch(conn, batch):
+    """Write a batch of (table, row) entries in a single transaction"""
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        # Group consecutive rows by table so insertion order is preserved
+        for table, entries in itertools.groupby(batch, key=lambda entry: entry[0]):
+            cursor.executemany(_INSERT_SQL[table], [row for _, row in entries])
+        cursor.execute('COMMIT')
+    except Exception:
+        cursor.execute('ROLLBACK')
+        raise
+
+def _serialize_log_row(table, row, backlogged):
+    """Serialize a queued queries row's parsed_data off the request path"""
+    if table != 'queries':
+        return row
+    
+    parsed_data = row[4]
+    if parsed_data is None or isinstance(parsed_data, str):
+        return row
+    
+    # While the writer is behind, keep parsed_data for only a sample of
+    # successful lookups to shed serialization work
+    if backlogged and row[5] == 'success' and random.random() >= LOG_PARSED_SAMPLE_RATE:
+        parsed_data = None
+    else:
+        parsed_data = fast_dumps(parsed_data)
+    return row[:4] + (parsed_data,) + row[5:]
+
+def _log_writer():
+    """Drain the log queue into the database until a None sentinel is received"""
+    conn = get_conn()
+    running = True
+    
+    while running:
+        entry = _log_queue.get()
+        if entry is None:
+            break
+        
+        batch = [entry]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                entry = _log_queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if entry is None:
+                running = False
+                break
+            batch.append(entry)
+        
+        # A row that can't be serialized is dropped on its own, not with its batch
+        backlogged = _log_queue.qsize() >= LOG_BATCH_SIZE
+        serialized = []
+        for table, row in batch:
+            try:
+                serialized.append((table, _serialize_log_row(table, row, backlogged)))
+            except Exception as e:
+                logger.error(f"Skipping unserializable {table} log row: {str(e)}")
+        
+        try:
+            if serialized:
+                _write_log_batch(conn, serialized)
+        except Exception as e:
+            logger.error(f"Error writing {len(serialized)} log rows: {str(e)}")
+    
+    conn.close()
+
+def _enqueue_log(table, row):
+    """Queue a row for the background writer without blocking the caller"""
+    try:
+        _log_queue.put_nowait((table, row))
+    except queue.Full:
+        logger.warning(f"Log queue full, dropping {table} row")
+
+def _flush_log_queue():
+    """Stop the background writer after it has written everything queued"""
+    try:
+        _log_queue.put(None, timeout=5)
+    except queue.Full:
+        logger.error("Log queue still full at shutdown, pending rows may be lost")
+    _log_thread.join(timeout=10)
+
 # Initialize database on startup
 init_db()
+optimize_db()
+
+_log_thread = threading.Thread(target=_log_writer, name='log-writer', daemon=True)
+_log_thread.start()
+atexit.register(_flush_log_queue)
+
+# Shared HTTP session for court website probes and PDF downloads, so
+# repeated requests reuse pooled keep-alive TCP/TLS connections
+HTTP = requests.Session()
+HTTP.verify = False
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+HTTP.mount('http://', _http_adapter)
+HTTP.mount('https://', _http_adapter)
+
+# Worker pool for probing the court website URLs concurrently
+PROBE_TIMEOUT = 8
+PROBE_DEADLINE = 10  # overall budget for one round of probes, including retries
+
+_probe_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix='court-probe')
 
-def test_court_website():
-    """Test if the Wardha District Court website is accessible"""
+def _probe_url(url, headers):
+    """Fetch a single court URL and return the response with its response time in ms"""
+    start_time = time.perf_counter()
+    response = HTTP.get(url, headers=headers, timeout=PROBE_TIMEOUT)
+    response_time = (time.perf_counter() - start_time) * 1000
+    return response, response_time
+
+def test_court_website(log_status=True):
+    """Test if the Wardha District Court website is accessible, logging each probe to court_status unless log_status is False"""
     test_urls = [
         'https://wardha.dcourts.gov.in/',
         'https://wardha.dcourts.gov.in/case-status-search-by-case-number/',
@@ -97,51 +416,126 @@ def test_court_website():
         'Upgrade-Insecure-Requests': '1',
     }
     
-    for url in test_urls:
-        try:
-            start_time = datetime.now()
-            response = requests.get(url, headers=headers, timeout=15, verify=False)
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+    # Probe all URLs at once and take whichever answers successfully first,
+    # giving up on stragglers once PROBE_DEADLINE has passed
+    futures = {_probe_pool.submit(_probe_url, url, headers): url for url in test_urls}
+    pending = set(futures)
+    deadline = time.monotonic() + PROBE_DEADLINE
+    
+    while pending:
+        done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                             return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        
+        for future in done:
+            url = futures[future]
+            try:
+                response, response_time = future.result()
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Failed to access {url}: {str(e)}")
+                if log_status:
+                    log_court_status('Wardha District Court', url, 'error', 0, str(e))
+                continue
             
             if response.status_code == 200:
                 logger.info(f"Court website accessible at: {url} (Response time: {response_time:.0f}ms)")
                 
+                # Probes that have not started yet are no longer needed
+                for other in pending:
+                    other.cancel()
+                
                 # Log the successful connection
-                log_court_status('Wardha District Court', url, 'accessible', response_time, None)
+                if log_status:
+                    log_court_status('Wardha District Court', url, 'accessible', response_time, None)
+                _store_probe_result(url)
                 return url
-            else:
+            elif log_status:
                 log_court_status('Wardha District Court', url, 'error', response_time, f"HTTP {response.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Failed to access {url}: {str(e)}")
-            log_court_status('Wardha District Court', url, 'error', 0, str(e))
-            continue
+    
+    for future in pending:
+        future.cancel()
+        logger.warning(f"Probe of {futures[future]} did not finish within {PROBE_DEADLINE}s")
+        if log_status:
+            log_court_status('Wardha District Court', futures[future], 'error', PROBE_DEADLINE * 1000, 'Probe deadline exceeded')
     
     logger.error("All Wardha District Court website URLs are inaccessible")
+    _store_probe_result(None)
     return None
 
 def log_court_status(court_name, url, status, response_time, error_details):
     """Log court website status to database"""
     try:
-        conn = sqlite3.connect('db/court_queries.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO court_status 
-            (court_name, url, status, response_time, error_details)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (court_name, url, status, int(response_time), error_details))
-        
-        conn.commit()
-        conn.close()
+        _enqueue_log('court_status', (court_name, url, status, int(response_time), error_details))
     except Exception as e:
         logger.error(f"Error logging court status: {str(e)}")
 
+# Probe results are reused for PROBE_CACHE_TTL seconds. After that, a request
+# still gets the previous result while one background probe refreshes it, so
+# /search does not wait on the court website; results older than
+# PROBE_STALE_LIMIT are probed again before answering. Nothing probes while
+# the app is idle.
+PROBE_CACHE_TTL = 60
+PROBE_STALE_LIMIT = 10 * 60
+
+_probe_cache = {'url': None, 'ts': 0, 'lock': threading.Lock()}
+
+def _store_probe_result(url):
+    """Record the outcome of the latest court website probe"""
+    _probe_cache['url'] = url
+    _probe_cache['ts'] = time.time()
+
+def get_cached_accessible_url():
+    """Return the last known accessible court URL, probing again once it has expired"""
+    age = time.time() - _probe_cache['ts']
+    if age < PROBE_CACHE_TTL:
+        return _probe_cache['url']
+    
+    if age < PROBE_STALE_LIMIT:
+        _start_probe_refresh()
+        return _probe_cache['url']
+    
+    with _probe_cache['lock']:
+        # Another request may have refreshed the cache while we were waiting
+        if time.time() - _probe_cache['ts'] < PROBE_CACHE_TTL:
+            return _probe_cache['url']
+        return test_court_website()
+
+def _refresh_probe_cache():
+    """Re-probe the court website in the background; the caller holds the probe lock"""
+    try:
+        # Background refreshes are not logged to court_status
+        test_court_website(log_status=False)
+    except Exception as e:
+        logger.error(f"Error refreshing court website probe: {str(e)}")
+    finally:
+        _probe_cache['lock'].release()
+
+def _start_probe_refresh():
+    """Start a background probe unless one is already running"""
+    if _probe_cache['lock'].acquire(blocking=False):
+        threading.Thread(target=_refresh_probe_cache, name='probe-refresh', daemon=True).start()
+
 @app.route('/')
 def index():
     """Main page with the search form"""
     return render_template('index.html')
 
+# Search form validation: a four digit year from 1950 onwards, and a case
+# number made of digits with optional dashes/slashes
+_YEAR_RE = re.compile(r'19[5-9]\d|2\d{3}')
+_CASE_NUMBER_RE = re.compile(r'[0-9/-]*[0-9][0-9/-]*')
+
+# Rejected search submissions by reason, reported by /api/stats
+_validation_errors = collections.Counter()
+_validation_errors_lock = threading.Lock()
+
+def _reject_search(reason, error_msg):
+    """Count a rejected search form and show it again with a 400"""
+    with _validation_errors_lock:
+        _validation_errors[reason] += 1
+    return render_template('index.html', error=error_msg), 400
+
 @app.route('/search', methods=['POST'])
 def search_case():
     """Handle case search requests for Wardha District Court"""
@@ -151,35 +545,27 @@ def search_case():
         case_number = request.form.get('case_number', '').strip()
         filing_year = request.form.get('filing_year', '').strip()
         
-        # Get user IP for logging
-        user_ip = request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR', 'unknown'))
-        
-        # Validate input
+        # Validate input before any logging or network I/O; rejected forms are
+        # only counted in memory so bad submissions cannot force database writes
         if not all([case_type, case_number, filing_year]):
-            error_msg = 'All fields are required'
-            log_query(case_type, case_number, filing_year, None, None, 'validation_error', error_msg, user_ip)
-            return render_template('index.html', error=error_msg)
+            return _reject_search('missing_fields', 'All fields are required')
         
-        try:
-            filing_year = int(filing_year)
-            current_year = datetime.now().year
-            if filing_year < 1950 or filing_year > current_year:
-                raise ValueError(f"Year must be between 1950 and {current_year}")
-        except ValueError as e:
-            error_msg = f'Please enter a valid filing year (1950-{datetime.now().year})'
-            log_query(case_type, case_number, filing_year, None, None, 'validation_error', error_msg, user_ip)
-            return render_template('index.html', error=error_msg)
+        current_year = year_for_second(int(time.time()))
+        if not _YEAR_RE.fullmatch(filing_year) or int(filing_year) > current_year:
+            return _reject_search('invalid_year', f'Please enter a valid filing year (1950-{current_year})')
+        filing_year = int(filing_year)
         
         # Validate case number (should be numeric for most court systems)
-        if not case_number.replace('/', '').replace('-', '').isdigit():
-            error_msg = 'Case number should contain only numbers, dashes, and slashes'
-            log_query(case_type, case_number, filing_year, None, None, 'validation_error', error_msg, user_ip)
-            return render_template('index.html', error=error_msg)
+        if not _CASE_NUMBER_RE.fullmatch(case_number):
+            return _reject_search('invalid_case_number', 'Case number should contain only numbers, dashes, and slashes')
+        
+        # Get user IP for logging
+        user_ip = request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR', 'unknown'))
         
         logger.info(f"Processing search request for Wardha District Court: {case_type} {case_number}/{filing_year} from IP: {user_ip}")
         
-        # Test court website accessibility first
-        accessible_url = test_court_website()
+        # Test court website accessibility first (cached between requests)
+        accessible_url = get_cached_accessible_url()
         case_data = None
         raw_response = None
         status = 'success'
@@ -234,7 +620,7 @@ def search_case():
         
         # Log the query
         log_query(case_type, case_number, filing_year, 
-                 raw_response, json.dumps(case_data, default=str), status, error_message, user_ip)
+                 raw_response, case_data, status, error_message, user_ip)
         
         return render_template('result.html', 
                              case_data=case_data,
@@ -252,6 +638,25 @@ def search_case():
                  request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR', 'unknown')))
         return render_template('index.html', error=error_msg)
 
+def _is_pdf_url(pdf_url, headers):
+    """Check whether pdf_url serves a PDF using a HEAD request, or its first bytes if needed"""
+    head = HTTP.head(pdf_url, headers=headers, timeout=10, allow_redirects=True)
+    if head.status_code == 200 and 'pdf' in head.headers.get('content-type', '').lower():
+        return True
+    
+    # Generic content types and servers that refuse HEAD get a look at the
+    # first bytes for the %PDF- signature instead
+    if head.status_code not in (200, 403, 405, 501):
+        return False
+    
+    probe = HTTP.get(pdf_url, headers={**headers, 'Range': 'bytes=0-255'}, timeout=10, stream=True)
+    try:
+        if probe.status_code not in (200, 206):
+            return False
+        return probe.raw.read(5, decode_content=True) == b'%PDF-'
+    finally:
+        probe.close()
+
 @app.route('/download_pdf')
 def download_pdf():
     """Download PDF from Wardha District Court website"""
@@ -278,7 +683,12 @@ def download_pdf():
         }
         
         try:
-            response = requests.get(pdf_url, headers=headers, timeout=30, verify=False, stream=True)
+            # Classify the URL cheaply before committing to the full download
+            if not _is_pdf_url(pdf_url, headers):
+                logger.warning(f"URL does not serve a PDF: {pdf_url}")
+                return jsonify({'error': 'Invalid PDF or file not found on Wardha District Court website'}), 404
+            
+            response = HTTP.get(pdf_url, headers=headers, timeout=30, stream=True)
             response.raise_for_status()
             
             # Check if response is actually a PDF
@@ -287,24 +697,29 @@ def download_pdf():
             
             if 'pdf' not in content_type and content_length < 1000:
                 logger.warning(f"Invalid PDF response: content-type={content_type}, length={content_length}")
+                response.close()
                 return jsonify({'error': 'Invalid PDF or file not found on Wardha District Court website'}), 404
             
-            # Read content
-            pdf_content = response.content
-            
-            if len(pdf_content) < 100:  # Very small file, likely an error page
-                logger.warning(f"PDF content too small: {len(pdf_content)} bytes")
+            if 0 < content_length < 100:  # Very small file, likely an error page
+                logger.warning(f"PDF content too small: {content_length} bytes")
+                response.close()
                 return jsonify({'error': 'PDF file appears to be corrupted or unavailable'}), 404
             
-            logger.info(f"Successfully downloaded PDF from Wardha District Court: {len(pdf_content)} bytes")
+            logger.info(f"Streaming PDF from Wardha District Court: {content_length or 'unknown'} bytes")
+            
+            def generate():
+                try:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        yield chunk
+                finally:
+                    response.close()
             
-            # Return PDF as file download
-            return send_file(
-                BytesIO(pdf_content),
-                as_attachment=True,
-                download_name=filename,
-                mimetype='application/pdf'
-            )
+            # Stream the PDF to the client as it arrives instead of buffering it
+            pdf_response = Response(generate(), mimetype='application/pdf')
+            pdf_response.headers.set('Content-Disposition', 'attachment', filename=filename)
+            if content_length and not response.headers.get('content-encoding'):
+                pdf_response.headers['Content-Length'] = str(content_length)
+            return pdf_response
         
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error downloading PDF from {pdf_url}: {str(e)}")
@@ -314,53 +729,78 @@ def download_pdf():
         logger.error(f"Unexpected error in download_pdf: {str(e)}", exc_info=True)
         return jsonify({'error': 'An unexpected error occurred while downloading PDF'}), 500
 
+# Case types offered by Wardha District Court. The list never changes at
+# runtime, so its JSON body is serialized once at import.
+CASE_TYPES = [
+    # Criminal Cases
+    {'value': 'Criminal Case', 'label': 'Criminal Case - General Criminal Matter'},
+    {'value': 'Sessions Case', 'label': 'Sessions Case - Sessions Trial'},
+    {'value': 'Cr. Misc.', 'label': 'Cr. Misc. - Criminal Miscellaneous'},
+    {'value': 'Cr. Appeal', 'label': 'Cr. Appeal - Criminal Appeal'},
+    {'value': 'Bail Application', 'label': 'Bail Application - Bail Matter'},
+    {'value': 'Cr. Revision', 'label': 'Cr. Revision - Criminal Revision'},
+    {'value': 'Anticipatory Bail', 'label': 'Anticipatory Bail - Pre-Arrest Bail'},
+    
+    # Civil Cases
+    {'value': 'Civil Suit', 'label': 'Civil Suit - Civil Matter'},
+    {'value': 'Title Suit', 'label': 'Title Suit - Property Title'},
+    {'value': 'Money Suit', 'label': 'Money Suit - Recovery of Money'},
+    {'value': 'Civil Appeal', 'label': 'Civil Appeal - Appeal from Civil Court'},
+    {'value': 'Civil Misc.', 'label': 'Civil Misc. - Civil Miscellaneous'},
+    {'value': 'Execution', 'label': 'Execution - Execution Petition'},
+    {'value': 'Partition Suit', 'label': 'Partition Suit - Property Partition'},
+    
+    # Special Cases
+    {'value': 'Marriage Petition', 'label': 'Marriage Petition - Matrimonial Matter'},
+    {'value': 'Motor Accident', 'label': 'Motor Accident - MACT Case'},
+    {'value': 'Land Revenue', 'label': 'Land Revenue - Revenue Matter'},
+    {'value': 'Labour Case', 'label': 'Labour Case - Industrial Dispute'},
+    {'value': 'Consumer Case', 'label': 'Consumer Case - Consumer Complaint'},
+    {'value': 'Misc. Application', 'label': 'Misc. Application - Miscellaneous Application'},
+    
+    # Family Court Cases
+    {'value': 'Divorce Petition', 'label': 'Divorce Petition - Divorce Matter'},
+    {'value': 'Maintenance', 'label': 'Maintenance - Maintenance Application'},
+    {'value': 'Custody', 'label': 'Custody - Child Custody'},
+    {'value': 'Adoption', 'label': 'Adoption - Adoption Petition'},
+    
+    # Juvenile Cases
+    {'value': 'JJ Act', 'label': 'JJ Act - Juvenile Justice Act'},
+    {'value': 'POCSO', 'label': 'POCSO - Protection of Children from Sexual Offences'},
+    
+    # Other Special Acts
+    {'value': 'NDPS', 'label': 'NDPS - Narcotic Drugs and Psychotropic Substances'},
+    {'value': 'SC/ST Act', 'label': 'SC/ST Act - Scheduled Castes and Scheduled Tribes Act'},
+    {'value': 'Domestic Violence', 'label': 'Domestic Violence - Protection of Women from DV Act'},
+    {'value': 'RTI Appeal', 'label': 'RTI Appeal - Right to Information Appeal'}
+]
+
+_CASE_TYPES_BYTES = json.dumps(CASE_TYPES).encode('utf-8')
+_CASE_TYPES_ETAG = hashlib.md5(_CASE_TYPES_BYTES).hexdigest()
+
+# Pre-compressed variant for clients accepting gzip, with its own ETag
+_CASE_TYPES_GZIP = gzip.compress(_CASE_TYPES_BYTES, compresslevel=6)
+_CASE_TYPES_GZIP_ETAG = f"{_CASE_TYPES_ETAG}-gzip"
+
 @app.route('/api/case_types')
 def get_case_types():
     """API endpoint to get available case types for Wardha District Court"""
-    case_types = [
-        # Criminal Cases
-        {'value': 'Criminal Case', 'label': 'Criminal Case - General Criminal Matter'},
-        {'value': 'Sessions Case', 'label': 'Sessions Case - Sessions Trial'},
-        {'value': 'Cr. Misc.', 'label': 'Cr. Misc. - Criminal Miscellaneous'},
-        {'value': 'Cr. Appeal', 'label': 'Cr. Appeal - Criminal Appeal'},
-        {'value': 'Bail Application', 'label': 'Bail Application - Bail Matter'},
-        {'value': 'Cr. Revision', 'label': 'Cr. Revision - Criminal Revision'},
-        {'value': 'Anticipatory Bail', 'label': 'Anticipatory Bail - Pre-Arrest Bail'},
-        
-        # Civil Cases
-        {'value': 'Civil Suit', 'label': 'Civil Suit - Civil Matter'},
-        {'value': 'Title Suit', 'label': 'Title Suit - Property Title'},
-        {'value': 'Money Suit', 'label': 'Money Suit - Recovery of Money'},
-        {'value': 'Civil Appeal', 'label': 'Civil Appeal - Appeal from Civil Court'},
-        {'value': 'Civil Misc.', 'label': 'Civil Misc. - Civil Miscellaneous'},
-        {'value': 'Execution', 'label': 'Execution - Execution Petition'},
-        {'value': 'Partition Suit', 'label': 'Partition Suit - Property Partition'},
-        
-        # Special Cases
-        {'value': 'Marriage Petition', 'label': 'Marriage Petition - Matrimonial Matter'},
-        {'value': 'Motor Accident', 'label': 'Motor Accident - MACT Case'},
-        {'value': 'Land Revenue', 'label': 'Land Revenue - Revenue Matter'},
-        {'value': 'Labour Case', 'label': 'Labour Case - Industrial Dispute'},
-        {'value': 'Consumer Case', 'label': 'Consumer Case - Consumer Complaint'},
-        {'value': 'Misc. Application', 'label': 'Misc. Application - Miscellaneous Application'},
-        
-        # Family Court Cases
-        {'value': 'Divorce Petition', 'label': 'Divorce Petition - Divorce Matter'},
-        {'value': 'Maintenance', 'label': 'Maintenance - Maintenance Application'},
-        {'value': 'Custody', 'label': 'Custody - Child Custody'},
-        {'value': 'Adoption', 'label': 'Adoption - Adoption Petition'},
-        
-        # Juvenile Cases
-        {'value': 'JJ Act', 'label': 'JJ Act - Juvenile Justice Act'},
-        {'value': 'POCSO', 'label': 'POCSO - Protection of Children from Sexual Offences'},
-        
-        # Other Special Acts
-        {'value': 'NDPS', 'label': 'NDPS - Narcotic Drugs and Psychotropic Substances'},
-        {'value': 'SC/ST Act', 'label': 'SC/ST Act - Scheduled Castes and Scheduled Tribes Act'},
-        {'value': 'Domestic Violence', 'label': 'Domestic Violence - Protection of Women from DV Act'},
-        {'value': 'RTI Appeal', 'label': 'RTI Appeal - Right to Information Appeal'}
-    ]
-    return jsonify(case_types)
+    use_gzip = request.accept_encodings['gzip'] > 0  # q=0 means "not acceptable"
+    etag = _CASE_TYPES_GZIP_ETAG if use_gzip else _CASE_TYPES_ETAG
+    
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(_CASE_TYPES_GZIP, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(_CASE_TYPES_BYTES, mimetype='application/json')
+    
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
 
 @app.route('/api/test_connection')
 def test_connection():
@@ -383,10 +823,11 @@ def test_connection():
         }), 503
 
 @app.route('/api/stats')
+@ttl_cache(seconds=30)
 def get_stats():
     """API endpoint to get query statistics"""
     try:
-        conn = sqlite3.connect('db/court_queries.db')
+        conn = get_db()
         cursor = conn.cursor()
         
         # Get total queries
@@ -415,13 +856,12 @@ def get_stats():
         ''')
         court_status_history = cursor.fetchall()
         
-        conn.close()
-        
         return jsonify({
             'total_queries': total_queries,
             'status_counts': status_counts,
             'recent_queries': recent_queries,
             'court_status_history': court_status_history,
+            'validation_errors': dict(_validation_errors),
             'court': 'Wardha District Court'
         })
     
@@ -429,90 +869,120 @@ def get_stats():
         logger.error(f"Error getting stats: {str(e)}")
         return jsonify({'error': 'Unable to fetch statistics'}), 500
 
-def create_mock_case_data(case_type, case_number, filing_year):
-    """Create mock case data for Wardha District Court when scraper is not available"""
-    mock_data = {
+# Constant parts of the demo data returned when live data is unavailable
+_MOCK_COURT_DETAILS = {
+    'address': 'District and Sessions Court, Sewagram Road, Wardha - 442001, Maharashtra',
+    'phone': '07152-244033',
+    'email': 'wardha.court@ecourts.gov.in'
+}
+
+# (year offset, month-day, description) for each demo order
+_MOCK_ORDERS = (
+    (0, '04-01', "Notice issued to respondents - Returnable on {next_date}"),
+    (0, '05-15', "Interim order passed - Status quo to be maintained"),
+    (0, '08-22', "Written statement filed by respondent - Evidence to commence"),
+    (1, '01-10', "Evidence of petitioner recorded - Cross-examination pending")
+)
+
+# Case type keywords mapped to a demo data bucket, checked in order
+_MOCK_CASE_TYPE_BUCKETS = (
+    (('criminal', 'cr.'), 'criminal'),
+    (('civil',), 'civil'),
+    (('marriage', 'divorce'), 'matrimonial'),
+    (('motor', 'mact'), 'motor')
+)
+
+# Bucket -> (petitioners, respondents, status, stage); names are formatted with case_number
+_MOCK_VARIATIONS = {
+    None: (
+        ("Demo Petitioner for case {case_number}", "Additional Petitioner (if applicable)"),
+        ("Demo Respondent for case {case_number}", "State of Maharashtra", "District Collector, Wardha"),
+        "Pending for final hearing",
+        "Evidence stage"
+    ),
+    'criminal': (
+        ("State of Maharashtra",),
+        ("Accused in case {case_number}", "Surety (if any)"),
+        "Pending for charge framing",
+        "Pre-trial stage"
+    ),
+    'civil': (
+        ("Plaintiff in case {case_number}",),
+        ("Defendant in case {case_number}",),
+        "Written statement stage",
+        "Pleadings stage"
+    ),
+    'matrimonial': (
+        ("Petitioner spouse in case {case_number}",),
+        ("Respondent spouse in case {case_number}",),
+        "Counseling stage",
+        "Mediation/Counseling"
+    ),
+    'motor': (
+        ("Claimant in case {case_number}",),
+        ("Owner of Vehicle", "Driver", "Insurance Company"),
+        "Evidence stage",
+        "Assessment of compensation"
+    )
+}
+
+def case_type_bucket(case_type):
+    """Map a case type to its demo data bucket, or None for the generic demo data"""
+    case_type_lower = case_type.lower()
+    for keywords, bucket in _MOCK_CASE_TYPE_BUCKETS:
+        if any(keyword in case_type_lower for keyword in keywords):
+            return bucket
+    return None
+
+@functools.lru_cache(maxsize=256)
+def _mock_case_template(case_type, case_number, filing_year):
+    """Build the time-independent part of the demo case data (cached, never mutate)"""
+    petitioners, respondents, status, stage = _MOCK_VARIATIONS[case_type_bucket(case_type)]
+    
+    return {
         'case_title': f"{case_type} {case_number}/{filing_year}",
         'court_name': 'District and Sessions Court, Wardha',
         'parties': {
-            'petitioner': [f"Demo Petitioner for case {case_number}", "Additional Petitioner (if applicable)"],
-            'respondent': [f"Demo Respondent for case {case_number}", "State of Maharashtra", "District Collector, Wardha"]
+            'petitioner': tuple(name.format(case_number=case_number) for name in petitioners),
+            'respondent': tuple(name.format(case_number=case_number) for name in respondents)
         },
         'filing_date': f"{filing_year}-03-15",
         'next_hearing_date': "2024-12-20",
-        'status': "Pending for final hearing",
-        'stage': "Evidence stage",
+        'status': status,
+        'stage': stage,
         'judge': "Shri/Smt. [Judge Name], District Judge, Wardha",
-        'orders': [
+        'orders': tuple(
             {
-                'date': f"{filing_year}-04-01",
-                'description': "Notice issued to respondents - Returnable on {next_date}",
-                'pdf_link': None
-            },
-            {
-                'date': f"{filing_year}-05-15",
-                'description': "Interim order passed - Status quo to be maintained",
-                'pdf_link': None
-            },
-            {
-                'date': f"{filing_year}-08-22",
-                'description': "Written statement filed by respondent - Evidence to commence",
-                'pdf_link': None
-            },
-            {
-                'date': f"{int(filing_year)+1}-01-10",
-                'description': "Evidence of petitioner recorded - Cross-examination pending",
+                'date': f"{int(filing_year) + year_offset}-{month_day}",
+                'description': description,
                 'pdf_link': None
             }
-        ],
-        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            for year_offset, month_day, description in _MOCK_ORDERS
+        ),
+        'last_updated': None,
         'note': 'This is demo data for Wardha District Court testing purposes. Live data could not be fetched from the court website.',
-        'court_details': {
-            'address': 'District and Sessions Court, Sewagram Road, Wardha - 442001, Maharashtra',
-            'phone': '07152-244033',
-            'email': 'wardha.court@ecourts.gov.in'
-        }
+        'court_details': _MOCK_COURT_DETAILS
     }
+
+def create_mock_case_data(case_type, case_number, filing_year):
+    """Create mock case data for Wardha District Court when scraper is not available"""
+    template = _mock_case_template(case_type, case_number, filing_year)
     
-    # Add some variation based on case type
-    if 'criminal' in case_type.lower() or 'cr.' in case_type.lower():
-        mock_data['parties']['petitioner'] = [f"State of Maharashtra"]
-        mock_data['parties']['respondent'] = [f"Accused in case {case_number}", "Surety (if any)"]
-        mock_data['status'] = "Pending for charge framing"
-        mock_data['stage'] = "Pre-trial stage"
-    elif 'civil' in case_type.lower():
-        mock_data['parties']['petitioner'] = [f"Plaintiff in case {case_number}"]
-        mock_data['parties']['respondent'] = [f"Defendant in case {case_number}"]
-        mock_data['status'] = "Written statement stage"
-        mock_data['stage'] = "Pleadings stage"
-    elif 'marriage' in case_type.lower() or 'divorce' in case_type.lower():
-        mock_data['parties']['petitioner'] = [f"Petitioner spouse in case {case_number}"]
-        mock_data['parties']['respondent'] = [f"Respondent spouse in case {case_number}"]
-        mock_data['status'] = "Counseling stage"
-        mock_data['stage'] = "Mediation/Counseling"
-    elif 'motor' in case_type.lower() or 'mact' in case_type.lower():
-        mock_data['parties']['petitioner'] = [f"Claimant in case {case_number}"]
-        mock_data['parties']['respondent'] = [f"Owner of Vehicle", "Driver", "Insurance Company"]
-        mock_data['status'] = "Evidence stage"
-        mock_data['stage'] = "Assessment of compensation"
+    # Callers annotate the result, so hand out copies of the cached containers
+    mock_data = dict(template)
+    mock_data['parties'] = {role: list(names) for role, names in template['parties'].items()}
+    mock_data['orders'] = [dict(order) for order in template['orders']]
+    mock_data['court_details'] = dict(template['court_details'])
+    mock_data['last_updated'] = ts_for_second(int(time.time()))
     
     return mock_data
 
 def log_query(case_type, case_number, filing_year, raw_response, parsed_data, status, error_message=None, user_ip=None):
-    """Log query details to database"""
+    """Log query details to database (parsed_data may be a dict, serialized by the log writer)"""
     try:
-        conn = sqlite3.connect('db/court_queries.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO queries 
-            (case_type, case_number, filing_year, raw_response, parsed_data, status, error_message, user_ip, court_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (case_type, case_number, filing_year, raw_response, parsed_data, status, error_message, user_ip, 'Wardha District Court'))
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"Query logged successfully for Wardha District Court: {case_type} {case_number}/{filing_year} - Status: {status}")
+        _enqueue_log('queries', (case_type, case_number, filing_year, raw_response, parsed_data,
+                                 status, error_message, user_ip, 'Wardha District Court'))
+        logger.info(f"Query queued for logging for Wardha District Court: {case_type} {case_number}/{filing_year} - Status: {status}")
     
     except Exception as e:
         logger.error(f"Error logging query: {str(e)}")
@@ -535,20 +1005,26 @@ def handle_exception(e):
 # Health check endpoint
 @app.route('/health')
 def health_check():
-    return jsonify({
+    response = jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': iso_for_second(int(time.time())),
         'scraper_available': SCRAPER_AVAILABLE,
         'court': 'Wardha District Court',
         'version': '1.0.0'
     })
+    
+    # Let pollers and proxies reuse the status briefly and revalidate with 304s
+    response.cache_control.max_age = 5
+    response.add_etag()
+    return response.make_conditional(request)
 
 # Dashboard endpoint for analytics
 @app.route('/dashboard')
+@ttl_cache(seconds=30)
 def dashboard():
     """Simple dashboard showing system statistics"""
     try:
-        conn = sqlite3.connect('db/court_queries.db')
+        conn = get_db()
         cursor = conn.cursor()
         
         # Get comprehensive stats
@@ -581,8 +1057,6 @@ def dashboard():
         ''')
         daily_stats = cursor.fetchall()
         
-        conn.close()
-        
         stats = {
             'total_queries': total_queries,
             'status_stats': status_stats,
@@ -605,4 +1079,11 @@ if __name__ == '__main__':
     logger.info(f"Debug mode: {debug_mode}")
     logger.info(f"Scraper available: {SCRAPER_AVAILABLE}")
     
-    app.run(host='0.0.0.0', port=port, debug=debug_mode)
\ No newline at end of file
+    if GEVENT_AVAILABLE and not debug_mode:
+        # gevent serves requests concurrently, so slow court website calls
+        # no longer queue behind each other
+        from gevent.pywsgi import WSGIServer
+        logger.info("Serving with gevent WSGIServer")
+        WSGIServer(('0.0.0.0', port), app).serve_forever()
+    else:
+        app.run(host='0.0.0.0', port=port, debug=debug_mode)
\ No newline at end of file
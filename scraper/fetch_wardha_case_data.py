@@ -1,25 +1,372 @@
+import certifi
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+import os
 import re
+import ssl
 import time
+import functools
 import logging
-from urllib.parse import urljoin, urlparse, quote
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import urljoin, urlparse, quote, urlencode
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from scraper.timestamps import ts_for_second, iso_for_second
+
+# Prefer lxml's C parser for BeautifulSoup, falling back to the standard library parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 # Disable SSL warnings for court websites with certificate issues
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Hosts whose certificates failed verification; requests to them skip it
+_insecure_hosts = set()
+
 logger = logging.getLogger(__name__)
 
+# Number of candidate URLs probed concurrently by _find_working_url
+URL_PROBE_WORKERS = 10
+
+# Last known-good court URL, shared across scraper instances and restarts.
+# Kept in the user's own cache directory, not a predictable path in /tmp
+# that any local user could write to
+WORKING_URL_CACHE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'wardha-court' / 'working_url.json'
+WORKING_URL_TTL = 3600  # seconds
+
+# Successful connection tests are reused for a short while; case type lists
+# rarely change, so they are kept per working URL for much longer
+CONNECTION_TEST_TTL = 30  # seconds
+CASE_TYPES_TTL = 3600  # seconds
+_connection_test_cache = {'result': None, 'ts': 0}
+_case_types_cache = {}
+
+# Court name stamped on debug info, connection tests and every order record
+COURT_NAME = 'Wardha District Court'
+
+# Party entries returned by _alternative_parsing when only page patterns match
+PLACEHOLDER_PETITIONER = 'Case information available - please check court website directly'
+PLACEHOLDER_RESPONDENT = 'Detailed parsing required - manual verification recommended'
+
+# Orders kept per case; extraction stops once this many are found
+MAX_ORDERS = 10
+
+# Headers scanned for a case title; later headings are page chrome, not the case
+MAX_TITLE_HEADERS = 50
+
+# Common date formats used in Indian courts, tried in order by _parse_date;
+# only the textual formats can match a string that contains letters, and only
+# the numeric ones a string that doesn't
+NUMERIC_DATE_FORMATS = (
+    '%d-%m-%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y/%m/%d',
+    '%d-%m-%y', '%d/%m/%y', '%y-%m-%d', '%y/%m/%d',
+    '%d.%m.%Y', '%d.%m.%y', '%Y.%m.%d',
+    '%d %m %Y', '%d %m %y', '%Y %m %d'
+)
+TEXTUAL_DATE_FORMATS = (
+    '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y',
+    '%B %d %Y', '%b %d %Y'
+)
+
+# Classes of divs that hold structured case details
+CASE_DETAIL_CLASSES = frozenset(['case-details', 'case-info', 'result', 'case-data'])
+
+# First-cell labels of order table rows, and words that make text an order entry
+ORDER_ROW_LABELS = ('order', 'judgment', 'date', 'आदेश', 'निर्णय')
+ORDER_KEYWORDS = ('order', 'judgment', 'hearing', 'notice')
+
+# Form strategies submitted concurrently, and the shared submission rate (requests/second)
+SUBMISSION_WORKERS = 8
+SUBMISSION_RATE = 4
+
+# Time budget for one search's submissions, and the longest Retry-After
+# honoured; a 429 asking for more can't stall every worker for that long
+SUBMISSION_DEADLINE = 60  # seconds
+MAX_RETRY_AFTER = 30  # seconds
+
+# Words whose presence suggests a page really is a court website
+VALID_INDICATORS = frozenset([
+    'case', 'court', 'wardha', 'district', 'ecourts', 
+    'case status', 'case number', 'filing', 'petitioner',
+    'maharashtra', 'judicial', 'search'
+])
+
+# Common error messages in Marathi and English
+ERROR_INDICATORS = (
+    'no record found', 'record not found', 'invalid case',
+    'case not found', 'no data available', 'no records found',
+    'invalid input', 'please enter valid', 'not exist',
+    'error occurred', 'invalid case number', 'case does not exist',
+    'रेकॉर्ड आढळला नाही', 'केस सापडला नाही', 'अवैध केस',
+    'कोणताही डेटा उपलब्ध नाही', 'कृपया वैध माहिती टाका'
+)
+
+CAPTCHA_TEXT_INDICATORS = ('captcha', 'verification code', 'security code')
+
+# Table row labels (English and Marathi) for each case detail, in priority order
+LABEL_KEYWORDS = {
+    'petitioner': ('petitioner', 'applicant', 'plaintiff', 'अर्जदार', 'फिर्यादी'),
+    'respondent': ('respondent', 'defendant', 'प्रतिवादी', 'बचावपक्ष'),
+    'filing': ('filing', 'दाखल', 'date'),
+    'hearing': ('next', 'hearing', 'list', 'सुनावणी', 'पुढील'),
+    'status': ('status', 'stage', 'स्थिती', 'टप्पा'),
+    'judge': ('judge', 'न्यायाधीश', 'न्यायमूर्ती'),
+    'current': ('current', 'present', 'सध्याचा')
+}
+
+_CASE_TYPE_NAME_RE = re.compile(r'case.*type|type.*case', re.IGNORECASE)
+# Parse only the case type dropdowns when listing supported case types
+_CASE_TYPE_SELECT_STRAINER = SoupStrainer('select', attrs={'name': _CASE_TYPE_NAME_RE})
+
+# Terms that mark a page as a case record in _alternative_parsing
+LEGAL_TERMS = (
+    'petitioner', 'respondent', 'plaintiff', 'defendant', 'hearing', 
+    'order', 'judgment', 'court', 'case', 'filing', 'status',
+    'अर्जदार', 'प्रतिवादी', 'सुनावणी', 'आदेश', 'न्यायालय', 'केस'
+)
+MAHARASHTRA_TERMS = ('wardha', 'maharashtra', 'district court', 'जिल्हा न्यायालय')
+
+# Search form field names for each case detail, checked in this order so a
+# name like 'case_year' is taken as the year rather than the case number
+FORM_FIELD_PATTERNS = (
+    ('year', re.compile(r'year', re.IGNORECASE)),
+    ('type', _CASE_TYPE_NAME_RE),
+    ('number', re.compile(r'case.*(no|num)|(no|num).*case', re.IGNORECASE)),
+)
+
+# CSS selectors for CAPTCHA widgets and the type reported for each
+CAPTCHA_INDICATORS = {
+    'img[src*="captcha"]': 'image',
+    'input[name*="captcha"]': 'input',
+    'div.captcha': 'div',
+    '.g-recaptcha': 'recaptcha',
+    'iframe[src*="recaptcha"]': 'recaptcha_iframe',
+    'script[src*="recaptcha"]': 'recaptcha_script',
+    'input[placeholder*="captcha"]': 'input_placeholder'
+}
+
+def _keyword_re(keywords, flags=re.IGNORECASE):
+    """Compile keywords into one alternation, longest first (case-insensitive by default)"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered), flags)
+
+# Zero-width lookahead so overlapping indicators are all seen, e.g. 'ecourts' in 'casecourts'
+_VALID_RE = re.compile(f'(?=({_keyword_re(VALID_INDICATORS).pattern}))', re.IGNORECASE)
+# Bytes twin of _VALID_RE (the indicators are ASCII) so probes needn't decode pages
+_VALID_BYTES_RE = re.compile(_VALID_RE.pattern.encode('ascii'), re.IGNORECASE)
+_ERROR_RE = _keyword_re(ERROR_INDICATORS)
+# Any-of-keywords tests on already lowercased text, one scan per test
+_ORDER_ROW_LABEL_RE = _keyword_re(ORDER_ROW_LABELS, flags=0)
+_ORDER_KEYWORD_RE = _keyword_re(ORDER_KEYWORDS, flags=0)
+_DIV_PETITIONER_RE = _keyword_re(('petitioner', 'applicant'), flags=0)
+_DIV_RESPONDENT_RE = _keyword_re(('respondent', 'defendant'), flags=0)
+_MARATHI_WORD_RE = _keyword_re(('न्यायालय', 'केस', 'सुनावणी', 'आदेश'), flags=0)
+
+# Lookaheads again, so terms sharing letters (e.g. 'petitioner' and
+# 'respondent' in 'petitionerespondent') are all reported; text is lowercased first
+_LEGAL_TERMS_RE = re.compile(f'(?=({_keyword_re(LEGAL_TERMS).pattern}))')
+_MAHARASHTRA_TERMS_RE = re.compile(f'(?=({_keyword_re(MAHARASHTRA_TERMS).pattern}))')
+_CAPTCHA_TEXT_RE = _keyword_re(CAPTCHA_TEXT_INDICATORS)
+# Every single word of the phrases, as bytes: markup can split a phrase
+# ('<b>Verification</b> code') but leaves each of its words whole
+_CAPTCHA_WORD_BYTES_RE = re.compile(
+    b'|'.join(sorted({re.escape(word.encode('utf-8')) for phrase in CAPTCHA_TEXT_INDICATORS for word in phrase.split()})),
+    re.IGNORECASE
+)
+
+# One union selector finds every CAPTCHA candidate; the compiled per-indicator
+# selectors then classify just those hits
+_CAPTCHA_SELECTOR = ', '.join(CAPTCHA_INDICATORS)
+_CAPTCHA_MATCHERS = {selector: soupsieve.compile(selector) for selector in CAPTCHA_INDICATORS}
+
+# Named group per label category inside a lookahead, so every keyword in a
+# label is found even where keywords overlap
+_LABEL_RE = re.compile('(?=' + '|'.join(
+    f'(?P<{group}>{_keyword_re(keywords).pattern})' for group, keywords in LABEL_KEYWORDS.items()
+) + ')')
+
+# Dates as DD-MM-YYYY or YYYY-MM-DD with '-', '/' or '.' separators; the
+# bounded forms pick dates out of page text, the grouped alternation out of order text
+_DATE_PATTERNS = (
+    re.compile(r'\b\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4}\b'),
+    re.compile(r'\b\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2}\b')
+)
+_ORDER_DATE_RE = re.compile(r'(\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4}|\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})')
+_DIGITS_RE = re.compile(r'\d+')
+# Whole numeric dates with one repeated '-', '/' or '.' separator; ASCII digits
+# only, since strptime's day/month patterns reject other digits
+_NUMERIC_DATE_RE = re.compile(
+    r'(?P<year_first>[0-9]{4})(?P<sep1>[-/.])(?P<month_ymd>[0-9]{1,2})(?P=sep1)(?P<day_ymd>[0-9]{1,2})'
+    r'|(?P<day>[0-9]{1,2})(?P<sep2>[-/.])(?P<month>[0-9]{1,2})(?P=sep2)(?P<year>[0-9]{4}|[0-9]{2})'
+)
+_PDF_HREF_RE = re.compile(r'\.pdf', re.IGNORECASE)
+# Root-relative link with no whitespace/control characters, ';' params,
+# fragment or empty query
+_PLAIN_PATH_RE = re.compile(r'/(?!/)[^\x00-\x20\x7f;?#]*(?:\?[^\x00-\x20\x7f#]+)?')
+_ORDER_CONTAINER_RE = re.compile(r'order|judgment|hearing', re.IGNORECASE)
+
+# The longest indicator matched at a position also implies the shorter ones
+# it contains (e.g. 'case status' implies 'case', 'ecourts' implies 'court')
+_VALID_IMPLIES = {
+    indicator: frozenset(other for other in VALID_INDICATORS if other in indicator)
+    for indicator in VALID_INDICATORS
+}
+
+def _valid_ymd(year, month, day):
+    """Check date parts against the ranges accepted for court dates"""
+    return 1 <= day <= 31 and 1 <= month <= 12 and 1950 <= year <= 2030
+
+# The same few date strings recur across search strategies and order rows
+@functools.lru_cache(maxsize=2048)
+def _parse_date(date_str):
+    """Parse date string into standard format (handles Indian date formats)"""
+    if not date_str or not date_str.strip():
+        return None
+    
+    date_str = date_str.strip()
+    
+    # Fast path for the usual numeric D-M-Y / Y-M-D dates. It only answers
+    # when the strptime loop below would have produced the same result, and
+    # otherwise leaves the string to the full logic
+    match = _NUMERIC_DATE_RE.fullmatch(date_str)
+    if match:
+        if match.group('year_first'):
+            year, month, day = int(match.group('year_first')), int(match.group('month_ymd')), int(match.group('day_ymd'))
+        else:
+            day, month, year_text = int(match.group('day')), int(match.group('month')), match.group('year')
+            year = int(year_text)
+            if len(year_text) == 2:
+                # strptime's %y rule
+                year += 2000 if year < 69 else 1900
+        if _valid_ymd(year, month, day):
+            try:
+                return datetime(year, month, day).strftime('%Y-%m-%d')
+            except ValueError:
+                pass  # e.g. 31 February; the loop below rejects it too
+    
+    formats = TEXTUAL_DATE_FORMATS if any(c.isalpha() for c in date_str) else NUMERIC_DATE_FORMATS
+    for fmt in formats:
+        try:
+            parsed_date = datetime.strptime(date_str, fmt)
+            # Ensure the year is reasonable
+            if 1950 <= parsed_date.year <= 2030:
+                return parsed_date.strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    
+    # Try to extract date components manually
+    date_numbers = _DIGITS_RE.findall(date_str)
+    if len(date_numbers) >= 3:
+        try:
+            # Assume DD-MM-YYYY or DD/MM/YYYY format (common in India)
+            day, month, year = int(date_numbers[0]), int(date_numbers[1]), int(date_numbers[2])
+            
+            # Handle 2-digit years: 00-29 are the 2000s, 30-99 the 1900s
+            if year < 100:
+                year += 2000 if year < 30 else 1900
+            
+            # Validate ranges
+            if _valid_ymd(year, month, day):
+                return f"{year:04d}-{month:02d}-{day:02d}"
+        except ValueError:
+            pass
+    
+    # If no format matches, return original string
+    logger.debug(f"Could not parse date from Wardha District Court: {date_str}")
+    return date_str
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second with bursts up to `rate`"""
+    
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self, deadline=None):
+        """Block until a token is available and take it; False if that would run past `deadline` (time.monotonic())"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                else:
+                    self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+    
+    def penalize(self, seconds):
+        """Hold back every caller for `seconds`, e.g. from a Retry-After header"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            # Resume with an empty bucket rather than a burst
+            self.tokens = 0.0
+            self.updated = self.blocked_until
+
+def _retry_after_seconds(value):
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def _is_cert_verification_error(error):
+    """Whether an SSL error was caused by the server's certificate failing verification"""
+    # requests and urllib3 wrap the ssl module's exception a few levels deep
+    pending, seen = [error], set()
+    while pending:
+        err = pending.pop()
+        if not isinstance(err, BaseException) or id(err) in seen:
+            continue
+        seen.add(id(err))
+        if isinstance(err, ssl.SSLCertVerificationError):
+            return True
+        pending.extend((getattr(err, 'reason', None), err.__cause__, err.__context__, *err.args))
+    return False
+
+# Rate limit for form submissions to the court website, shared by all workers
+_submit_limiter = _TokenBucket(SUBMISSION_RATE)
+
+def _order_record(description, pdf_link=None, date=None):
+    """Build an order entry in the shape the API and database expect"""
+    return {
+        'description': description,
+        'pdf_link': pdf_link,
+        'date': date,
+        'court': COURT_NAME
+    }
+
 class WardhaDistrictCourtScraper:
     """Enhanced scraper for Wardha District Court case data with improved error handling"""
     
     def __init__(self):
         self.base_url = "https://wardha.dcourts.gov.in"
+        base = urlparse(self.base_url)
+        self._base_origin = f"{base.scheme}://{base.netloc}"
         # Alternative URLs for Wardha District Court
         self.search_urls = [
             f"{self.base_url}/case-status-search-by-case-number/",
@@ -35,20 +382,40 @@ class WardhaDistrictCourtScraper:
             "https://njdg.ecourts.gov.in/njdgnew/index.php"
         ]
         
-        # Initialize session with retry strategy
+        # Initialize session with retry strategy and a connection pool large
+        # enough for concurrent lookups to keep their TLS connections alive
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "OPTIONS", "POST"],
-            backoff_factor=1
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
+            backoff_factor=1,
+            # TLS failures (bad certificates above all) won't fix themselves
+            # on a retry, so they reach _request without any backoff
+            other=0,
+            # urllib3 would otherwise retry any 429 carrying Retry-After,
+            # sleeping in the throttled thread; the first 429 goes straight
+            # back to _submit_form, whose penalty slows down every worker
+            respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
-        self.last_raw_response = None
-        self.working_url = None
+        # Verify against certifi's bundle so pooled connections can reuse one
+        # SSL context; hosts with broken certificates fall back in _request
+        self.session.verify = certifi.where()
+        
+        # Last successful submission; decoded only if last_raw_response is read
+        self._last_response = None
+        self.working_url = self._load_cached_working_url()
+        # Search page fetched while probing, reused once by fetch_case_data
+        self._last_probe_response = None
         self.debug_info = {}
         
         # Set up session with comprehensive headers for Indian court websites
@@ -56,7 +423,8 @@ class WardhaDistrictCourtScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Accept-Language': 'en-US,en;q=0.9,hi;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only advertise encodings urllib3 can decode (br needs brotli installed)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -64,66 +432,168 @@ class WardhaDistrictCourtScraper:
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0',
-            'DNT': '1'
+            'DNT': '1',
+            # Referer for better acceptance of form submissions
+            'Referer': self.base_url
         })
     
+    @property
+    def last_raw_response(self):
+        """Text of the last successful form submission, if any"""
+        return self._last_response.text if self._last_response is not None else None
+    
+    def _request(self, method, url, **kwargs):
+        """Send a request, retrying without certificate verification for hosts with broken certificates"""
+        host = urlparse(url).hostname
+        if host in _insecure_hosts:
+            return self.session.request(method, url, verify=False, **kwargs)
+        
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.exceptions.SSLError as e:
+            # Court websites often have certificate issues; other TLS failures
+            # (handshake, protocol) are not a reason to stop verifying a host
+            if not _is_cert_verification_error(e):
+                raise
+            logger.warning(f"Certificate verification failed for {host}, continuing without it: {str(e)}")
+            _insecure_hosts.add(host)
+            return self.session.request(method, url, verify=False, **kwargs)
+    
+    def _load_cached_working_url(self):
+        """Return the cached working URL if it was validated within the TTL"""
+        try:
+            data = json.loads(WORKING_URL_CACHE.read_text())
+            # Only ever reuse one of our own candidate URLs
+            if data['url'] in self.search_urls and time.time() - data['ts'] < WORKING_URL_TTL:
+                logger.info(f"Using cached Wardha District Court URL: {data['url']}")
+                return data['url']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_working_url(self, url):
+        """Atomically persist a validated working URL for later instances"""
+        try:
+            WORKING_URL_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=WORKING_URL_CACHE.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'url': url, 'ts': time.time()}, f)
+            os.replace(tmp_path, WORKING_URL_CACHE)
+        except OSError as e:
+            logger.debug(f"Could not cache working URL: {str(e)}")
+    
+    def _forget_working_url(self):
+        """Drop the working URL so the next fetch probes again"""
+        self.working_url = None
+        try:
+            WORKING_URL_CACHE.unlink()
+        except OSError:
+            pass
+    
+    def _head_url(self, url):
+        """Cheaply check a candidate URL with HEAD, returning its test info and whether it is worth a GET"""
+        logger.debug("Testing Wardha District Court URL: %s", url)
+        response = self._request('HEAD', url, timeout=10, allow_redirects=True)
+        content_type = response.headers.get('content-type', '')
+        
+        url_test_info = {
+            'url': url,
+            'status_code': response.status_code,
+            'content_type': content_type,
+            'success': response.status_code == 200,
+            'final_url': response.url
+        }
+        
+        # Many servers refuse or mishandle HEAD but serve GET normally
+        if response.status_code in (403, 404, 405, 501):
+            return url_test_info, True
+        
+        if response.status_code == 200 and (not content_type or 'html' in content_type.lower()):
+            return url_test_info, True
+        
+        url_test_info['reason'] = 'HEAD check failed'
+        return url_test_info, False
+    
+    def _probe_url(self, url):
+        """Fetch a candidate URL, returning its test info and the response if it looks like a Wardha District Court page"""
+        response = self._request('GET', url, timeout=15)
+        body = response.content
+        
+        url_test_info = {
+            'url': url,
+            'status_code': response.status_code,
+            'content_length': len(body),
+            'content_type': response.headers.get('content-type', ''),
+            'success': response.status_code == 200,
+            'final_url': response.url
+        }
+        
+        if response.status_code == 200:
+            # Additional checks for valid court website
+            found = set()
+            for match in set(_VALID_BYTES_RE.findall(body)):
+                found |= _VALID_IMPLIES[match.decode('ascii').lower()]
+            valid_count = len(found)
+            
+            if (len(body) > 1000 and 
+                'html' in response.headers.get('content-type', '').lower() and
+                valid_count >= 3):
+                url_test_info['valid_indicators'] = valid_count
+                return url_test_info, response
+            
+            url_test_info['reason'] = f'Content validation failed - indicators: {valid_count}/10'
+        
+        return url_test_info, None
+    
     def _find_working_url(self):
         """Find a working URL from the list of possible Wardha District Court URLs"""
         if self.working_url:
             return self.working_url
             
         self.debug_info['tested_urls'] = []
+        record = logger.isEnabledFor(logging.DEBUG)
         
-        for url in self.search_urls:
-            try:
-                logger.info(f"Testing Wardha District Court URL: {url}")
-                response = self.session.get(url, timeout=15, verify=False)
-                
-                url_test_info = {
-                    'url': url,
-                    'status_code': response.status_code,
-                    'content_length': len(response.content),
-                    'content_type': response.headers.get('content-type', ''),
-                    'success': response.status_code == 200,
-                    'final_url': response.url
-                }
+        # HEAD every candidate at once so one slow host doesn't delay the rest,
+        # then take them in list order: only the highest-priority URL that
+        # passed HEAD is downloaded, and the next one only if its content
+        # fails validation, as when they were checked one by one
+        pool = ThreadPoolExecutor(max_workers=URL_PROBE_WORKERS)
+        futures = [pool.submit(self._head_url, url) for url in self.search_urls]
+        
+        try:
+            for probed, (url, future) in enumerate(zip(self.search_urls, futures), 1):
+                try:
+                    url_test_info, head_passed = future.result()
+                    valid_response = None
+                    if head_passed:
+                        url_test_info, valid_response = self._probe_url(url)
+                except Exception as e:
+                    logger.warning(f"Wardha District Court URL {url} failed: {str(e)}")
+                    if record:
+                        self.debug_info['tested_urls'].append({
+                            'url': url,
+                            'error': str(e),
+                            'success': False
+                        })
+                    continue
                 
-                if response.status_code == 200:
-                    # Additional checks for valid court website
-                    content_lower = response.text.lower()
-                    valid_indicators = [
-                        'case', 'court', 'wardha', 'district', 'ecourts', 
-                        'case status', 'case number', 'filing', 'petitioner',
-                        'maharashtra', 'judicial', 'search'
-                    ]
-                    
-                    valid_count = sum(1 for indicator in valid_indicators if indicator in content_lower)
-                    
-                    if (len(response.content) > 1000 and 
-                        'html' in response.headers.get('content-type', '').lower() and
-                        valid_count >= 3):
-                        
-                        logger.info(f"Working Wardha District Court URL found: {url}")
-                        self.working_url = url
-                        url_test_info['selected'] = True
-                        url_test_info['valid_indicators'] = valid_count
+                if valid_response is not None:
+                    logger.info(f"Probed {probed} Wardha District Court URLs, selected {url}")
+                    self.working_url = url
+                    self._last_probe_response = valid_response
+                    self._save_working_url(url)
+                    url_test_info['selected'] = True
+                    if record:
                         self.debug_info['tested_urls'].append(url_test_info)
-                        return url
-                    else:
-                        url_test_info['reason'] = f'Content validation failed - indicators: {valid_count}/10'
+                    return url
                 
-                self.debug_info['tested_urls'].append(url_test_info)
-                    
-            except Exception as e:
-                logger.warning(f"Wardha District Court URL {url} failed: {str(e)}")
-                self.debug_info['tested_urls'].append({
-                    'url': url,
-                    'error': str(e),
-                    'success': False
-                })
-                continue
+                if record:
+                    self.debug_info['tested_urls'].append(url_test_info)
+        finally:
+            # Drop probes that have not started; running ones finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
         
-        logger.error("No working Wardha District Court URL found")
+        logger.error(f"No working Wardha District Court URL found after probing {len(futures)} URLs")
         return None
     
     def fetch_case_data(self, case_type, case_number, filing_year):
@@ -138,9 +608,9 @@ class WardhaDistrictCourtScraper:
                 'case_type': case_type,
                 'case_number': case_number,
                 'filing_year': filing_year,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': iso_for_second(int(time.time())),
                 'steps': [],
-                'court': 'Wardha District Court'
+                'court': COURT_NAME
             }
             
             # Find a working URL
@@ -157,9 +627,13 @@ class WardhaDistrictCourtScraper:
             
             # Load the search page
             try:
-                logger.info(f"Loading Wardha District Court search page: {working_url}")
-                search_page = self.session.get(working_url, timeout=20, verify=False)
-                search_page.raise_for_status()
+                # Reuse the page fetched while probing rather than requesting it again
+                search_page = self._last_probe_response
+                self._last_probe_response = None
+                if search_page is None:
+                    logger.info(f"Loading Wardha District Court search page: {working_url}")
+                    search_page = self._request('GET', working_url, timeout=20)
+                    search_page.raise_for_status()
                 
                 self.debug_info['steps'].append('Successfully loaded search page')
                 self.debug_info['search_page_info'] = {
@@ -170,6 +644,7 @@ class WardhaDistrictCourtScraper:
                 }
                 
             except requests.exceptions.HTTPError as e:
+                self._forget_working_url()
                 if e.response.status_code == 404:
                     return {
                         'error': f'Wardha District Court case status page not found',
@@ -183,6 +658,7 @@ class WardhaDistrictCourtScraper:
                         'debug_info': self.debug_info
                     }
             except requests.exceptions.RequestException as e:
+                self._forget_working_url()
                 return {
                     'error': 'Network error accessing Wardha District Court website',
                     'details': str(e),
@@ -190,11 +666,11 @@ class WardhaDistrictCourtScraper:
                 }
             
             # Parse the search page
-            soup = BeautifulSoup(search_page.content, 'html.parser')
+            soup = BeautifulSoup(search_page.content, HTML_PARSER)
             self._analyze_page_structure(soup)
             
             # Check if the page requires CAPTCHA
-            captcha_info = self._check_captcha(soup)
+            captcha_info = self._check_captcha(soup, search_page.content)
             if captcha_info['has_captcha']:
                 return {
                     'error': 'CAPTCHA verification required',
@@ -236,7 +712,7 @@ class WardhaDistrictCourtScraper:
                 'debug_info': self.debug_info
             }
     
-    def _check_captcha(self, soup):
+    def _check_captcha(self, soup, raw_html=None):
         """Check if the page has CAPTCHA requirements"""
         captcha_info = {
             'has_captcha': False,
@@ -244,31 +720,29 @@ class WardhaDistrictCourtScraper:
             'captcha_elements': []
         }
         
-        # Look for common CAPTCHA indicators
-        captcha_indicators = [
-            {'selector': 'img[src*="captcha"]', 'type': 'image'},
-            {'selector': 'input[name*="captcha"]', 'type': 'input'},
-            {'selector': 'div.captcha', 'type': 'div'},
-            {'selector': '.g-recaptcha', 'type': 'recaptcha'},
-            {'selector': 'iframe[src*="recaptcha"]', 'type': 'recaptcha_iframe'},
-            {'selector': 'script[src*="recaptcha"]', 'type': 'recaptcha_script'},
-            {'selector': 'input[placeholder*="captcha"]', 'type': 'input_placeholder'}
-        ]
+        # Look for common CAPTCHA indicators with one walk over the tree,
+        # then sort the hits into the indicator types they match
+        counts = dict.fromkeys(CAPTCHA_INDICATORS, 0)
+        for element in soup.select(_CAPTCHA_SELECTOR):
+            for selector, matcher in _CAPTCHA_MATCHERS.items():
+                if matcher.match(element):
+                    counts[selector] += 1
         
-        for indicator in captcha_indicators:
-            elements = soup.select(indicator['selector'])
-            if elements:
+        for selector, captcha_type in CAPTCHA_INDICATORS.items():
+            if counts[selector]:
                 captcha_info['has_captcha'] = True
-                captcha_info['captcha_type'] = indicator['type']
+                captcha_info['captcha_type'] = captcha_type
                 captcha_info['captcha_elements'].append({
-                    'type': indicator['type'],
-                    'count': len(elements),
-                    'selector': indicator['selector']
+                    'type': captcha_type,
+                    'count': counts[selector],
+                    'selector': selector
                 })
         
-        # Check for CAPTCHA in page text
-        page_text = soup.get_text().lower()
-        if any(word in page_text for word in ['captcha', 'verification code', 'security code']):
+        # Check for CAPTCHA in page text. Unless the page uses numeric
+        # character references, a page whose raw HTML holds no word of any
+        # phrase can't have a phrase in its text, so the text walk is skipped
+        if ((raw_html is None or b'&#' in raw_html or _CAPTCHA_WORD_BYTES_RE.search(raw_html)) and
+                _CAPTCHA_TEXT_RE.search(soup.get_text())):
             captcha_info['has_captcha'] = True
             if not captcha_info['captcha_type']:
                 captcha_info['captcha_type'] = 'text_based'
@@ -278,6 +752,12 @@ class WardhaDistrictCourtScraper:
     def _analyze_page_structure(self, soup):
         """Analyze the Wardha District Court page structure to understand the form layout"""
         forms = soup.find_all('form')
+        
+        # The detailed layout is only diagnostic; skip the walk unless debugging
+        if not logger.isEnabledFor(logging.DEBUG):
+            self.debug_info['page_analysis'] = {'forms_found': len(forms)}
+            return
+        
         self.debug_info['page_analysis'] = {
             'forms_found': len(forms),
             'form_details': [],
@@ -297,53 +777,62 @@ class WardhaDistrictCourtScraper:
                 'form_class': form.get('class', [])
             }
             
-            # Analyze inputs
-            for inp in form.find_all('input'):
-                input_info = {
-                    'name': inp.get('name'),
-                    'type': inp.get('type', 'text'),
-                    'value': inp.get('value', ''),
-                    'id': inp.get('id'),
-                    'placeholder': inp.get('placeholder', ''),
-                    'class': inp.get('class', []),
-                    'required': inp.has_attr('required')
-                }
-                form_info['inputs'].append(input_info)
-            
-            # Analyze selects (dropdowns)
-            for sel in form.find_all('select'):
-                options = []
-                for opt in sel.find_all('option'):
-                    options.append({
-                        'value': opt.get('value', ''),
-                        'text': opt.get_text(strip=True),
-                        'selected': opt.has_attr('selected')
+            # Analyze inputs, selects (dropdowns), options and buttons in a
+            # single walk over the form instead of one find_all per tag type
+            select_options = {}
+            for el in form.descendants:
+                tag_name = getattr(el, 'name', None)
+                
+                if tag_name == 'input':
+                    form_info['inputs'].append({
+                        'name': el.get('name'),
+                        'type': el.get('type', 'text'),
+                        'value': el.get('value', ''),
+                        'id': el.get('id'),
+                        'placeholder': el.get('placeholder', ''),
+                        'class': el.get('class', []),
+                        'required': el.has_attr('required')
                     })
+                    if el.get('type') in ['button', 'submit', 'reset']:
+                        form_info['buttons'].append(self._button_info(el))
+                
+                elif tag_name == 'button':
+                    form_info['buttons'].append(self._button_info(el))
                 
-                select_info = {
+                elif tag_name == 'select':
+                    select_options[el] = []
+                
+                elif tag_name == 'option':
+                    select = el.find_parent('select')
+                    if select is not None and select in select_options:
+                        select_options[select].append({
+                            'value': el.get('value', ''),
+                            'text': el.get_text(strip=True),
+                            'selected': el.has_attr('selected')
+                        })
+            
+            for sel, options in select_options.items():
+                form_info['selects'].append({
                     'name': sel.get('name'),
                     'id': sel.get('id'),
                     'class': sel.get('class', []),
                     'options_count': len(options),
                     'sample_options': options[:10],  # First 10 options
                     'required': sel.has_attr('required')
-                }
-                form_info['selects'].append(select_info)
-            
-            # Analyze buttons
-            for btn in form.find_all(['button', 'input']):
-                if btn.name == 'input' and btn.get('type') not in ['button', 'submit', 'reset']:
-                    continue
-                form_info['buttons'].append({
-                    'type': btn.get('type', 'button'),
-                    'name': btn.get('name'),
-                    'value': btn.get('value', ''),
-                    'text': btn.get_text(strip=True),
-                    'class': btn.get('class', [])
                 })
             
             self.debug_info['page_analysis']['form_details'].append(form_info)
     
+    def _button_info(self, btn):
+        """Describe a form button for the page analysis"""
+        return {
+            'type': btn.get('type', 'button'),
+            'name': btn.get('name'),
+            'value': btn.get('value', ''),
+            'text': btn.get_text(strip=True),
+            'class': btn.get('class', [])
+        }
+    
     def _prepare_form_data(self, soup, case_type, case_number, filing_year):
         """Prepare form data for submission with multiple strategies for Wardha District Court"""
         
@@ -411,6 +900,13 @@ class WardhaDistrictCourtScraper:
             }
         ]
         
+        # When the page's own form names its case fields, submit that first and
+        # keep only the two most common conventions as fallbacks
+        discovered = self._discover_form_fields(soup, case_type, case_number, filing_year)
+        if discovered:
+            form_variations = [discovered] + form_variations[:2]
+            self.debug_info['discovered_form_fields'] = list(discovered.keys())
+        
         # Add hidden fields to each variation
         enhanced_variations = []
         for variation in form_variations:
@@ -421,6 +917,40 @@ class WardhaDistrictCourtScraper:
         self.debug_info['form_strategies'] = len(enhanced_variations)
         return enhanced_variations
     
+    def _discover_form_fields(self, soup, case_type, case_number, filing_year):
+        """Build a payload from the real case type/number/year field names of the page's search form"""
+        for form in soup.find_all('form'):
+            fields = {}
+            submit = None
+            
+            for element in form.find_all(['input', 'select', 'textarea']):
+                name = element.get('name')
+                field_type = (element.get('type') or 'text').lower()
+                if not name or field_type == 'hidden':
+                    continue
+                
+                if field_type in ('submit', 'button', 'image'):
+                    if submit is None:
+                        submit = (name, element.get('value', ''))
+                    continue
+                
+                for role, pattern in FORM_FIELD_PATTERNS:
+                    if role not in fields and pattern.search(name):
+                        fields[role] = name
+                        break
+            
+            if len(fields) == len(FORM_FIELD_PATTERNS):
+                payload = {
+                    fields['type']: case_type,
+                    fields['number']: case_number,
+                    fields['year']: str(filing_year)
+                }
+                if submit:
+                    payload[submit[0]] = submit[1]
+                return payload
+        
+        return None
+    
     def _extract_hidden_fields(self, soup):
         """Extract hidden form fields including ASP.NET viewstate and other tokens"""
         hidden_fields = {}
@@ -455,65 +985,40 @@ class WardhaDistrictCourtScraper:
         """Attempt form submission with different strategies for Wardha District Court"""
         
         self.debug_info['submission_attempts'] = []
+        record = logger.isEnabledFor(logging.DEBUG)
         
-        for idx, form_data in enumerate(form_data_list):
-            attempt_info = {
-                'strategy': idx + 1,
-                'form_fields': list(form_data.keys()),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            try:
-                logger.info(f"Attempting Wardha District Court search submission {idx+1}/{len(form_data_list)}")
-                
-                # Try different submission methods
-                methods_to_try = [
-                    {'method': 'POST', 'endpoint': ''},
-                    {'method': 'POST', 'endpoint': '/case-status-result'},
-                    {'method': 'POST', 'endpoint': '/search'},
-                    {'method': 'GET', 'endpoint': ''},
-                    {'method': 'GET', 'endpoint': '/case-status'}
-                ]
-                
-                for method_info in methods_to_try:
-                    try:
-                        url = working_url + method_info['endpoint']
-                        response = self._submit_form(url, form_data, method=method_info['method'])
-                        
-                        if response and response.status_code == 200:
-                            attempt_info['method'] = method_info['method']
-                            attempt_info['endpoint'] = method_info['endpoint']
-                            attempt_info['response_info'] = {
-                                'status_code': response.status_code,
-                                'content_length': len(response.content),
-                                'final_url': response.url,
-                                'content_type': response.headers.get('content-type', '')
-                            }
-                            
-                            # Parse the response
-                            case_data = self._parse_response(response, case_type, case_number, filing_year)
-                            
-                            if case_data and not case_data.get('error'):
-                                attempt_info['result'] = 'success'
-                                self.debug_info['submission_attempts'].append(attempt_info)
-                                return case_data
-                            else:
-                                attempt_info['parse_result'] = case_data.get('error') if case_data else 'No valid data parsed'
-                                break  # Try next strategy
-                    except Exception as method_error:
-                        logger.debug(f"Method {method_info['method']} failed: {str(method_error)}")
-                        continue
-                
-                attempt_info['result'] = 'failed'
-                
-            except Exception as e:
-                logger.warning(f"Wardha District Court submission strategy {idx+1} failed: {str(e)}")
-                attempt_info['result'] = 'exception'
-                attempt_info['error'] = str(e)
-                
-            finally:
-                self.debug_info['submission_attempts'].append(attempt_info)
-                time.sleep(2)  # Rate limiting for court website
+        # Run the strategies concurrently and keep the first one that parses
+        # valid data; the shared rate limiter keeps the court site from being hammered
+        found = threading.Event()
+        deadline = time.monotonic() + SUBMISSION_DEADLINE
+        pool = ThreadPoolExecutor(max_workers=SUBMISSION_WORKERS)
+        futures = [
+            pool.submit(self._attempt_strategy, idx, working_url, form_data, len(form_data_list),
+                        case_type, case_number, filing_year, found, deadline)
+            for idx, form_data in enumerate(form_data_list)
+        ]
+        
+        # Workers never touch self._last_response; it is set once here, from the
+        # winning strategy, or else from the last strategy that got a page back
+        responses = {}
+        try:
+            for tried, future in enumerate(as_completed(futures), 1):
+                attempt_info, case_data, response = future.result()
+                if record:
+                    self.debug_info['submission_attempts'].append(attempt_info)
+                if case_data:
+                    found.set()
+                    self._last_response = response
+                    logger.info(f"Tried {tried} Wardha District Court search strategies, success=True")
+                    return case_data
+                if response is not None:
+                    responses[attempt_info['strategy']] = response
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        if responses:
+            self._last_response = responses[max(responses)]
+        logger.info(f"Tried {len(futures)} Wardha District Court search strategies, success=False")
         
         # All strategies failed
         return {
@@ -522,35 +1027,116 @@ class WardhaDistrictCourtScraper:
             'strategies_attempted': len(form_data_list)
         }
     
+    def _attempt_strategy(self, idx, working_url, form_data, total, case_type, case_number, filing_year, found, deadline):
+        """Try one form variation against each submission method, returning (attempt_info, case_data, response)"""
+        attempt_info = {
+            'strategy': idx + 1,
+            'form_fields': list(form_data.keys()),
+            'timestamp': iso_for_second(int(time.time()))
+        }
+        
+        response = None
+        try:
+            logger.debug("Attempting Wardha District Court search submission %d/%d", idx + 1, total)
+            
+            # Encode the form once for every method tried below; None values
+            # are dropped as requests would do for a dict
+            encoded_form = urlencode(
+                [(name, value) for name, value in form_data.items() if value is not None],
+                doseq=True
+            )
+            
+            # Try different submission methods
+            methods_to_try = [
+                {'method': 'POST', 'endpoint': ''},
+                {'method': 'POST', 'endpoint': '/case-status-result'},
+                {'method': 'POST', 'endpoint': '/search'},
+                {'method': 'GET', 'endpoint': ''},
+                {'method': 'GET', 'endpoint': '/case-status'}
+            ]
+            
+            for method_info in methods_to_try:
+                # Another strategy already found the case
+                if found.is_set():
+                    attempt_info['result'] = 'cancelled'
+                    return attempt_info, None, response
+                
+                try:
+                    url = working_url + method_info['endpoint']
+                    if not _submit_limiter.acquire(deadline):
+                        # The rate limit (e.g. after a 429) would outlast this search
+                        attempt_info['result'] = 'rate_limited'
+                        return attempt_info, None, response
+                    submitted = self._submit_form(url, encoded_form, method=method_info['method'])
+                    
+                    if submitted and submitted.status_code == 200:
+                        response = submitted
+                        attempt_info['method'] = method_info['method']
+                        attempt_info['endpoint'] = method_info['endpoint']
+                        attempt_info['response_info'] = {
+                            'status_code': response.status_code,
+                            'content_length': len(response.content),
+                            'final_url': response.url,
+                            'content_type': response.headers.get('content-type', '')
+                        }
+                        
+                        # Parse the response
+                        case_data = self._parse_response(response, case_type, case_number, filing_year)
+                        
+                        if case_data and not case_data.get('error'):
+                            attempt_info['result'] = 'success'
+                            return attempt_info, case_data, response
+                        else:
+                            attempt_info['parse_result'] = case_data.get('error') if case_data else 'No valid data parsed'
+                            break  # Try next strategy
+                except Exception as method_error:
+                    logger.debug(f"Method {method_info['method']} failed: {str(method_error)}")
+                    continue
+            
+            attempt_info['result'] = 'failed'
+            
+        except Exception as e:
+            logger.warning(f"Wardha District Court submission strategy {idx+1} failed: {str(e)}")
+            attempt_info['result'] = 'exception'
+            attempt_info['error'] = str(e)
+        
+        return attempt_info, None, response
+    
     def _submit_form(self, url, form_data, method='POST'):
         """Submit form to Wardha District Court with proper error handling"""
         try:
-            # Add referer header for better acceptance
-            headers = self.session.headers.copy()
-            headers['Referer'] = self.base_url
-            
             if method.upper() == 'POST':
-                response = self.session.post(
+                # requests only sets the form content type for dict bodies
+                headers = {'Content-Type': 'application/x-www-form-urlencoded'} if isinstance(form_data, str) else None
+                response = self._request(
+                    'POST',
                     url,
                     data=form_data,
                     headers=headers,
                     timeout=30,
-                    verify=False,
                     allow_redirects=True
                 )
             else:
-                response = self.session.get(
+                response = self._request(
+                    'GET',
                     url,
                     params=form_data,
-                    headers=headers,
                     timeout=30,
-                    verify=False,
                     allow_redirects=True
                 )
             
             if response.status_code == 200:
-                self.last_raw_response = response.text
                 return response
+            elif response.status_code == 429:
+                # Throttled: back off every worker for as long as the server asks
+                retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    retry_after = min(retry_after, MAX_RETRY_AFTER)
+                    logger.warning(f"Wardha District Court rate limited submissions, waiting {retry_after:.0f}s")
+                    _submit_limiter.penalize(retry_after)
+                else:
+                    logger.warning(f"Wardha District Court form submission returned status {response.status_code}")
+                return None
             else:
                 logger.warning(f"Wardha District Court form submission returned status {response.status_code}")
                 return None
@@ -562,32 +1148,29 @@ class WardhaDistrictCourtScraper:
     def _parse_response(self, response, case_type, case_number, filing_year):
         """Parse the response from Wardha District Court website"""
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            body = response.content
             
-            # Check for common error messages in Marathi and English
-            page_text = soup.get_text().lower()
-            error_indicators = [
-                'no record found', 'record not found', 'invalid case',
-                'case not found', 'no data available', 'no records found',
-                'invalid input', 'please enter valid', 'not exist',
-                'error occurred', 'invalid case number', 'case does not exist',
-                'रेकॉर्ड आढळला नाही', 'केस सापडला नाही', 'अवैध केस',
-                'कोणताही डेटा उपलब्ध नाही', 'कृपया वैध माहिती टाका'
-            ]
+            soup = BeautifulSoup(body, HTML_PARSER)
             
-            for error_msg in error_indicators:
-                if error_msg in page_text:
-                    return {
-                        'error': f'Case {case_type} {case_number}/{filing_year} not found in Wardha District Court',
-                        'message': 'Case not found in court database. Please verify case details.',
-                        'found_error_indicator': error_msg
-                    }
+            # Check for common error messages in Marathi and English. Only the
+            # visible text is searched: get_text() leaves out scripts, styles
+            # and comments, where validation messages like "please enter valid
+            # case number" appear on pages that do hold a case
+            page_text = soup.get_text().lower()
+            error_match = _ERROR_RE.search(page_text)
+            if error_match:
+                return {
+                    'error': f'Case {case_type} {case_number}/{filing_year} not found in Wardha District Court',
+                    'message': 'Case not found in court database. Please verify case details.',
+                    'found_error_indicator': error_match.group(0)
+                }
             
             # Try to extract case information
             case_data = self._extract_case_info(soup, case_type, case_number, filing_year)
             
             # If we found meaningful data, return it
             if self._is_valid_case_data(case_data):
+                case_data['last_updated'] = ts_for_second(int(time.time()))
                 return case_data
             
             # Try alternative parsing methods
@@ -599,7 +1182,7 @@ class WardhaDistrictCourtScraper:
             return {
                 'error': f'Case {case_type} {case_number}/{filing_year} not found in Wardha District Court',
                 'message': 'No case information could be extracted from the response.',
-                'response_length': len(response.content)
+                'response_length': len(body)
             }
             
         except Exception as e:
@@ -614,72 +1197,81 @@ class WardhaDistrictCourtScraper:
         case_data = {
             'case_title': f"{case_type} {case_number}/{filing_year}",
             'court_name': 'District and Sessions Court, Wardha',
-            'parties': {'petitioner': [], 'respondent': []},
+            # Dicts keep first-seen order while deduplicating; made lists at the end
+            'parties': {'petitioner': {}, 'respondent': {}},
             'filing_date': None,
             'next_hearing_date': None,
             'status': None,
             'stage': None,
             'judge': None,
             'orders': [],
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'last_updated': None  # Stamped by _parse_response once the data is kept
         }
         
         # Look for tables containing case information (common in eCourts)
-        tables = soup.find_all('table')
+        for label, value in self._table_rows(soup):
+            if not value:
+                continue
+            
+            # Parse different fields based on labels (English and Marathi);
+            # one scan finds every label group, which are then tried in priority order
+            groups = {match.lastgroup for match in _LABEL_RE.finditer(label)}
+            if not groups:
+                continue
+            
+            if 'petitioner' in groups:
+                case_data['parties']['petitioner'].setdefault(value)
+            elif 'respondent' in groups:
+                case_data['parties']['respondent'].setdefault(value)
+            elif 'filing' in groups and 'date' in label:
+                case_data['filing_date'] = self._parse_date(value)
+            elif 'hearing' in groups:
+                if 'date' in label:
+                    case_data['next_hearing_date'] = self._parse_date(value)
+            elif 'status' in groups:
+                if 'status' in label:
+                    case_data['status'] = value
+                else:
+                    case_data['stage'] = value
+            elif 'judge' in groups:
+                case_data['judge'] = value
+            elif 'current' in groups:
+                if not case_data['status']:
+                    case_data['status'] = value
         
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True).lower()
-                    value = cells[1].get_text(strip=True)
-                    
-                    if not value:
-                        continue
-                    
-                    # Parse different fields based on labels (English and Marathi)
-                    if any(keyword in label for keyword in ['petitioner', 'applicant', 'plaintiff', 'अर्जदार', 'फिर्यादी']):
-                        if value not in case_data['parties']['petitioner']:
-                            case_data['parties']['petitioner'].append(value)
-                    elif any(keyword in label for keyword in ['respondent', 'defendant', 'प्रतिवादी', 'बचावपक्ष']):
-                        if value not in case_data['parties']['respondent']:
-                            case_data['parties']['respondent'].append(value)
-                    elif any(keyword in label for keyword in ['filing', 'दाखल', 'date']) and 'date' in label:
-                        case_data['filing_date'] = self._parse_date(value)
-                    elif any(keyword in label for keyword in ['next', 'hearing', 'list', 'सुनावणी', 'पुढील']):
-                        if 'date' in label:
-                            case_data['next_hearing_date'] = self._parse_date(value)
-                    elif any(keyword in label for keyword in ['status', 'stage', 'स्थिती', 'टप्पा']):
-                        if 'status' in label:
-                            case_data['status'] = value
-                        else:
-                            case_data['stage'] = value
-                    elif any(keyword in label for keyword in ['judge', 'न्यायाधीश', 'न्यायमूर्ती']):
-                        case_data['judge'] = value
-                    elif any(keyword in label for keyword in ['current', 'present', 'सध्याचा']):
-                        if not case_data['status']:
-                            case_data['status'] = value
+        # One walk indexes the elements the remaining lookups need
+        page_index = self._index_page(soup)
         
         # Look for orders and judgments
-        case_data['orders'] = self._extract_orders(soup)
+        case_data['orders'] = self._extract_orders(page_index)
+        
+        year_text = str(filing_year)
         
         # Look for case title in headers
-        for header in soup.find_all(['h1', 'h2', 'h3', 'h4']):
+        for header in page_index['headers']:
             header_text = header.get_text(strip=True)
-            if (case_number in header_text and str(filing_year) in header_text) or 'wardha' in header_text.lower():
+            if (case_number in header_text and year_text in header_text) or 'wardha' in header_text.lower():
                 case_data['case_title'] = header_text
                 break
         
         # Look for additional case details in div elements
-        for div in soup.find_all('div', class_=['case-details', 'case-info', 'result', 'case-data']):
+        for div in page_index['detail_divs']:
             div_text = div.get_text()
-            if case_number in div_text and str(filing_year) in div_text:
+            if case_number in div_text and year_text in div_text:
                 # Extract additional information from structured divs
                 self._extract_from_structured_div(div, case_data)
         
+        case_data['parties'] = {role: list(names) for role, names in case_data['parties'].items()}
         return case_data
     
+    def _table_rows(self, soup):
+        """Yield (lowercased label, value) text from the first two cells of each table row"""
+        for table in soup.find_all('table'):
+            for row in table.find_all('tr'):
+                cells = row.find_all(['td', 'th'])
+                if len(cells) >= 2:
+                    yield cells[0].get_text(strip=True).lower(), cells[1].get_text(strip=True)
+    
     def _extract_from_structured_div(self, div, case_data):
         """Extract information from structured div elements"""
         # Look for labeled information within the div
@@ -692,28 +1284,23 @@ class WardhaDistrictCourtScraper:
             if next_sibling:
                 value = next_sibling.strip() if isinstance(next_sibling, str) else next_sibling.get_text(strip=True)
                 
-                if value and any(keyword in label_text for keyword in ['petitioner', 'applicant']):
-                    if value not in case_data['parties']['petitioner']:
-                        case_data['parties']['petitioner'].append(value)
-                elif value and any(keyword in label_text for keyword in ['respondent', 'defendant']):
-                    if value not in case_data['parties']['respondent']:
-                        case_data['parties']['respondent'].append(value)
+                if value and _DIV_PETITIONER_RE.search(label_text):
+                    case_data['parties']['petitioner'].setdefault(value)
+                elif value and _DIV_RESPONDENT_RE.search(label_text):
+                    case_data['parties']['respondent'].setdefault(value)
     
     def _is_valid_case_data(self, case_data):
         """Check if extracted case data is meaningful for Wardha District Court"""
         if not case_data:
             return False
         
-        # Check if we have at least some meaningful information
-        has_parties = (case_data.get('parties', {}).get('petitioner') or 
-                      case_data.get('parties', {}).get('respondent'))
-        has_dates = (case_data.get('filing_date') or 
-                    case_data.get('next_hearing_date'))
-        has_status = case_data.get('status') or case_data.get('stage')
-        has_orders = case_data.get('orders')
-        has_judge = case_data.get('judge')
-        
-        return bool(has_parties or has_dates or has_status or has_orders or has_judge)
+        # Check if we have at least some meaningful information, stopping at
+        # the first field found; status and parties are filled most often
+        parties = case_data.get('parties', {})
+        return bool(case_data.get('status') or case_data.get('stage') or
+                    parties.get('petitioner') or parties.get('respondent') or
+                    case_data.get('filing_date') or case_data.get('next_hearing_date') or
+                    case_data.get('orders') or case_data.get('judge'))
     
     def _alternative_parsing(self, soup, page_text, case_type, case_number, filing_year):
         """Alternative parsing method for different Wardha District Court page structures"""
@@ -726,29 +1313,22 @@ class WardhaDistrictCourtScraper:
             patterns_found = {}
             
             # Look for date patterns (DD-MM-YYYY, DD/MM/YYYY formats common in India)
-            date_patterns = [
-                r'\b\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4}\b',
-                r'\b\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2}\b'
-            ]
             dates = []
-            for pattern in date_patterns:
-                dates.extend(re.findall(pattern, page_text))
+            for pattern in _DATE_PATTERNS:
+                dates.extend(pattern.findall(page_text))
             if dates:
                 patterns_found['dates'] = list(set(dates))[:5]  # First 5 unique dates
             
-            # Look for common legal terms in English and Marathi
-            legal_terms = [
-                'petitioner', 'respondent', 'plaintiff', 'defendant', 'hearing', 
-                'order', 'judgment', 'court', 'case', 'filing', 'status',
-                'अर्जदार', 'प्रतिवादी', 'सुनावणी', 'आदेश', 'न्यायालय', 'केस'
-            ]
-            found_terms = [term for term in legal_terms if term in page_text.lower()]
+            # Look for common legal terms in English and Marathi, one scan per
+            # term list, reported in the lists' order (page_text is lowercased)
+            found = set(_LEGAL_TERMS_RE.findall(page_text))
+            found_terms = [term for term in LEGAL_TERMS if term in found]
             if found_terms:
                 patterns_found['legal_terms'] = found_terms
             
             # Look for Maharashtra-specific terms
-            maharashtra_terms = ['wardha', 'maharashtra', 'district court', 'जिल्हा न्यायालय']
-            found_mh_terms = [term for term in maharashtra_terms if term in page_text.lower()]
+            found = set(_MAHARASHTRA_TERMS_RE.findall(page_text))
+            found_mh_terms = [term for term in MAHARASHTRA_TERMS if term in found]
             if found_mh_terms:
                 patterns_found['maharashtra_terms'] = found_mh_terms
             
@@ -757,200 +1337,180 @@ class WardhaDistrictCourtScraper:
                     'case_title': f"{case_type} {case_number}/{filing_year}",
                     'court_name': 'District and Sessions Court, Wardha',
                     'parties': {
-                        'petitioner': ['Case information available - please check court website directly'],
-                        'respondent': ['Detailed parsing required - manual verification recommended']
+                        'petitioner': [PLACEHOLDER_PETITIONER],
+                        'respondent': [PLACEHOLDER_RESPONDENT]
                     },
                     'filing_date': f"{filing_year}-01-01",  # Placeholder
                     'next_hearing_date': None,
                     'status': "Case found but requires detailed parsing",
                     'stage': "Information extraction in progress",
                     'orders': [],
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'last_updated': ts_for_second(int(time.time())),
                     'note': 'Partial information extracted from Wardha District Court. Please verify details on court website.',
                     'patterns_found': patterns_found
                 }
         
         return None
     
-    def _extract_orders(self, soup):
+    def _extract_orders(self, page_index):
         """Extract order/judgment information and PDF links for Wardha District Court"""
         orders = []
+        seen_descriptions = set()
         
         # Look for PDF links
-        pdf_links = soup.find_all('a', href=re.compile(r'\.pdf', re.I))
-        
-        for link in pdf_links:
+        for link in page_index['pdf_links']:
             href = link.get('href')
             if href:
                 # Make absolute URL
                 if not href.startswith('http'):
-                    href = urljoin(self.base_url, href)
+                    href = self._absolutize(href)
                 
                 link_text = link.get_text(strip=True)
                 if not link_text:
                     link_text = 'Wardha District Court Document'
                 
-                order = {
-                    'description': link_text,
-                    'pdf_link': href,
-                    'date': None,
-                    'court': 'Wardha District Court'
-                }
-                
                 # Try to extract date from link text or surrounding content
-                date_patterns = [
-                    r'(\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4})',
-                    r'(\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})'
-                ]
-                
-                for pattern in date_patterns:
-                    date_match = re.search(pattern, link_text)
-                    if date_match:
-                        order['date'] = self._parse_date(date_match.group(1))
-                        break
+                date = None
+                date_match = _ORDER_DATE_RE.search(link_text)
+                if date_match:
+                    date = self._parse_date(date_match.group(1))
                 
-                if not order['date']:
+                if not date:
                     # Look for date in parent elements
                     parent = link.parent
                     if parent:
                         parent_text = parent.get_text()
-                        for pattern in date_patterns:
-                            date_match = re.search(pattern, parent_text)
-                            if date_match:
-                                order['date'] = self._parse_date(date_match.group(1))
-                                break
+                        date_match = _ORDER_DATE_RE.search(parent_text)
+                        if date_match:
+                            date = self._parse_date(date_match.group(1))
                 
-                orders.append(order)
+                orders.append(_order_record(link_text, href, date))
+                seen_descriptions.add(link_text)
+                if len(orders) >= MAX_ORDERS:
+                    return orders
         
         # Look for order information in tables
-        for table in soup.find_all('table'):
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    first_cell = cells[0].get_text(strip=True).lower()
-                    if any(keyword in first_cell for keyword in ['order', 'judgment', 'date', 'आदेश', 'निर्णय']):
-                        order_text = ' '.join([cell.get_text(strip=True) for cell in cells])
+        for row in page_index['order_rows']:
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 2:
+                # Most rows fail the label check, so only walk the other cells on a match
+                first_cell = cells[0].get_text(strip=True)
+                if _ORDER_ROW_LABEL_RE.search(first_cell.lower()):
+                    order_text = ' '.join([first_cell] + [cell.get_text(strip=True) for cell in cells[1:]])
+                    
+                    # Check if this row contains meaningful order information
+                    if len(order_text) > 20 and order_text not in seen_descriptions:
+                        if not _ORDER_KEYWORD_RE.search(order_text.lower()):
+                            continue
+                        
+                        # Try to extract date
+                        date = None
+                        date_match = _ORDER_DATE_RE.search(order_text)
+                        if date_match:
+                            date = self._parse_date(date_match.group(1))
                         
-                        # Check if this row contains meaningful order information
-                        if (len(order_text) > 20 and 
-                            not any(order['description'] == order_text for order in orders) and
-                            any(keyword in order_text.lower() for keyword in ['order', 'judgment', 'hearing', 'notice'])):
-                            
-                            order = {
-                                'description': order_text,
-                                'pdf_link': None,
-                                'date': None,
-                                'court': 'Wardha District Court'
-                            }
-                            
-                            # Try to extract date
-                            for pattern in [r'(\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4})', r'(\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})']:
-                                date_match = re.search(pattern, order_text)
-                                if date_match:
-                                    order['date'] = self._parse_date(date_match.group(1))
-                                    break
-                            
-                            orders.append(order)
+                        orders.append(_order_record(order_text, date=date))
+                        seen_descriptions.add(order_text)
+                        if len(orders) >= MAX_ORDERS:
+                            return orders
         
         # Look for order lists or divs
-        order_containers = soup.find_all(['div', 'ul', 'ol'], class_=re.compile(r'order|judgment|hearing', re.I))
-        for container in order_containers:
-            items = container.find_all(['li', 'p', 'div'])
-            for item in items:
-                item_text = item.get_text(strip=True)
-                if (len(item_text) > 15 and 
-                    any(keyword in item_text.lower() for keyword in ['order', 'hearing', 'notice', 'judgment'])):
-                    
-                    order = {
-                        'description': item_text,
-                        'pdf_link': None,
-                        'date': None,
-                        'court': 'Wardha District Court'
-                    }
-                    
-                    # Look for PDF link within the item
-                    pdf_link = item.find('a', href=re.compile(r'\.pdf', re.I))
-                    if pdf_link:
-                        href = pdf_link.get('href')
-                        if not href.startswith('http'):
-                            href = urljoin(self.base_url, href)
-                        order['pdf_link'] = href
-                    
-                    # Extract date
-                    for pattern in [r'(\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4})', r'(\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})']:
-                        date_match = re.search(pattern, item_text)
-                        if date_match:
-                            order['date'] = self._parse_date(date_match.group(1))
-                            break
-                    
-                    if not any(existing_order['description'] == order['description'] for existing_order in orders):
-                        orders.append(order)
+        for item in page_index['order_items']:
+            item_text = item.get_text(strip=True)
+            if len(item_text) > 15 and item_text not in seen_descriptions:
+                if not _ORDER_KEYWORD_RE.search(item_text.lower()):
+                    continue
+                
+                # Look for PDF link within the item
+                href = None
+                pdf_link = item.find('a', href=_PDF_HREF_RE)
+                if pdf_link:
+                    href = pdf_link.get('href')
+                    if not href.startswith('http'):
+                        href = self._absolutize(href)
+                
+                # Extract date
+                date = None
+                date_match = _ORDER_DATE_RE.search(item_text)
+                if date_match:
+                    date = self._parse_date(date_match.group(1))
+                
+                orders.append(_order_record(item_text, href, date))
+                seen_descriptions.add(item_text)
+                if len(orders) >= MAX_ORDERS:
+                    return orders
         
-        return orders[:10]  # Limit to 10 most relevant orders
+        return orders
     
-    def _parse_date(self, date_str):
-        """Parse date string into standard format (handles Indian date formats)"""
-        if not date_str or not date_str.strip():
-            return None
-        
-        date_str = date_str.strip()
-        
-        # Common date formats used in Indian courts
-        date_formats = [
-            '%d-%m-%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y/%m/%d',
-            '%d-%m-%y', '%d/%m/%y', '%y-%m-%d', '%y/%m/%d',
-            '%d.%m.%Y', '%d.%m.%y', '%Y.%m.%d',
-            '%d %m %Y', '%d %m %y', '%Y %m %d',
-            '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y',
-            '%B %d %Y', '%b %d %Y',
-            # Marathi month names (if needed)
-            '%d-%m-%Y', '%d/%m/%Y'  # Fallback to standard formats
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                # Ensure the year is reasonable
-                if 1950 <= parsed_date.year <= 2030:
-                    return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
+    def _absolutize(self, href):
+        """Resolve a link against the court site, skipping urljoin for plain root-relative paths"""
+        # Root-relative paths (with an optional query) resolve to origin + path;
+        # anything urljoin would normalize goes through urljoin
+        if _PLAIN_PATH_RE.fullmatch(href) and '/.' not in href:
+            return self._base_origin + href
+        return urljoin(self.base_url, href)
+    
+    def _index_page(self, soup):
+        """Gather headers, case detail divs, PDF links, table rows and order list items in one walk over the tree"""
+        headers, detail_divs, pdf_links, order_rows, order_items = [], [], [], [], []
         
-        # Try to extract date components manually
-        date_numbers = re.findall(r'\d+', date_str)
-        if len(date_numbers) >= 3:
-            try:
-                # Assume DD-MM-YYYY or DD/MM/YYYY format (common in India)
-                day, month, year = int(date_numbers[0]), int(date_numbers[1]), int(date_numbers[2])
-                
-                # Handle 2-digit years
-                if year < 100:
-                    if year < 30:  # Assume 2000s
-                        year += 2000
-                    else:  # Assume 1900s
-                        year += 1900
-                
-                # Validate ranges
-                if 1 <= day <= 31 and 1 <= month <= 12 and 1950 <= year <= 2030:
-                    return f"{year:04d}-{month:02d}-{day:02d}"
-            except ValueError:
-                pass
+        # Each entry carries whether the node sits inside a table and inside an
+        # order container; children are pushed reversed to keep document order
+        stack = [(child, False, False) for child in reversed(soup.contents)]
+        while stack:
+            node, in_table, in_container = stack.pop()
+            name = node.name
+            if name is None:
+                continue  # Text, comments and other strings
+            
+            classes = node.get('class', [])
+            if name == 'a':
+                href = node.get('href')
+                if href and _PDF_HREF_RE.search(href):
+                    pdf_links.append(node)
+            elif name == 'tr' and in_table:
+                order_rows.append(node)
+            elif name in ('h1', 'h2', 'h3', 'h4'):
+                if len(headers) < MAX_TITLE_HEADERS:
+                    headers.append(node)
+            elif name == 'div' and not CASE_DETAIL_CLASSES.isdisjoint(classes):
+                detail_divs.append(node)
+            
+            if in_container and name in ('li', 'p', 'div'):
+                order_items.append(node)
+            
+            child_in_table = in_table or name == 'table'
+            child_in_container = in_container or (
+                name in ('div', 'ul', 'ol') and
+                bool(_ORDER_CONTAINER_RE.search(' '.join(classes)))
+            )
+            stack.extend((child, child_in_table, child_in_container) for child in reversed(node.contents))
         
-        # If no format matches, return original string
-        logger.debug(f"Could not parse date from Wardha District Court: {date_str}")
-        return date_str
+        return {
+            'headers': headers,
+            'detail_divs': detail_divs,
+            'pdf_links': pdf_links,
+            'order_rows': order_rows,
+            'order_items': order_items
+        }
+    
+    def _parse_date(self, date_str):
+        """Parse date string into standard format (handles Indian date formats)"""
+        return _parse_date(date_str)
     
     def test_connection(self):
         """Test connection to Wardha District Court website and return detailed information"""
+        if time.time() - _connection_test_cache['ts'] < CONNECTION_TEST_TTL:
+            return dict(_connection_test_cache['result'])
+        
         working_url = self._find_working_url()
         
         result = {
             'status': 'success' if working_url else 'error',
             'working_url': working_url,
             'debug_info': self.debug_info,
-            'timestamp': datetime.now().isoformat(),
-            'court': 'Wardha District Court'
+            'timestamp': iso_for_second(int(time.time())),
+            'court': COURT_NAME
         }
         
         if working_url:
@@ -958,14 +1518,17 @@ class WardhaDistrictCourtScraper:
             
             # Try to get additional information about the search page
             try:
-                response = self.session.get(working_url, timeout=15, verify=False)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                response = self._last_probe_response
+                self._last_probe_response = None
+                if response is None:
+                    response = self._request('GET', working_url, timeout=15)
+                soup = BeautifulSoup(response.content, HTML_PARSER)
                 
                 forms = soup.find_all('form')
                 result['search_forms_found'] = len(forms)
                 
                 # Check for CAPTCHA
-                captcha_info = self._check_captcha(soup)
+                captcha_info = self._check_captcha(soup, response.content)
                 result['captcha_required'] = captcha_info['has_captcha']
                 result['captcha_type'] = captcha_info['captcha_type']
                 
@@ -976,9 +1539,9 @@ class WardhaDistrictCourtScraper:
                 else:
                     result['search_capability'] = 'forms_not_found'
                 
-                # Check page language
-                page_text = soup.get_text().lower()
-                if any(hindi_word in page_text for hindi_word in ['न्यायालय', 'केस', 'सुनावणी', 'आदेश']):
+                # Check page language; Devanagari has no case, so the text
+                # is searched as-is rather than lowercased first
+                if _MARATHI_WORD_RE.search(soup.get_text()):
                     result['page_language'] = 'bilingual'
                 else:
                     result['page_language'] = 'english'
@@ -989,6 +1552,11 @@ class WardhaDistrictCourtScraper:
         else:
             result['message'] = 'Wardha District Court website is not accessible'
             result['tested_urls'] = self.search_urls
+        
+        # Only successes are reused so an outage is noticed on the next check
+        if result['status'] == 'success':
+            _connection_test_cache['result'] = result
+            _connection_test_cache['ts'] = time.time()
             
         return result
     
@@ -999,13 +1567,21 @@ class WardhaDistrictCourtScraper:
             if not working_url:
                 return []
             
-            response = self.session.get(working_url, timeout=15, verify=False)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            cached = _case_types_cache.get(working_url)
+            if cached and time.time() - cached[0] < CASE_TYPES_TTL:
+                return list(cached[1])
+            
+            # Only build the case type dropdowns; the rest of the page is skipped
+            response = self._last_probe_response
+            self._last_probe_response = None
+            if response is None:
+                response = self._request('GET', working_url, timeout=15)
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_CASE_TYPE_SELECT_STRAINER)
             
             case_types = []
             
             # Look for case type dropdowns
-            case_type_selects = soup.find_all('select', {'name': re.compile(r'case.*type|type.*case', re.I)})
+            case_type_selects = soup.find_all('select', {'name': _CASE_TYPE_NAME_RE})
             
             for select in case_type_selects:
                 options = select.find_all('option')
@@ -1019,7 +1595,10 @@ class WardhaDistrictCourtScraper:
                             'source': 'website_dropdown'
                         })
             
-            return case_types[:30]  # Limit to 30 types
+            case_types = case_types[:30]  # Limit to 30 types
+            if case_types:
+                _case_types_cache[working_url] = (time.time(), case_types)
+            return list(case_types)
             
         except Exception as e:
             logger.error(f"Error getting case types from Wardha District Court: {str(e)}")
@@ -0,0 +1,20 @@
+import functools
+from datetime import datetime
+
+# Timestamp helpers memoized per wall-clock second; maxsize=1 means the
+# cached value is replaced as soon as the second changes. They only need the
+# standard library, so app.py can use them even when the scraper can't import.
+@functools.lru_cache(maxsize=1)
+def ts_for_second(second):
+    """Format a Unix timestamp (whole seconds) as 'YYYY-MM-DD HH:MM:SS'"""
+    return datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+
+@functools.lru_cache(maxsize=1)
+def iso_for_second(second):
+    """Format a Unix timestamp (whole seconds) in ISO 8601"""
+    return datetime.fromtimestamp(second).isoformat()
+
+@functools.lru_cache(maxsize=1)
+def year_for_second(second):
+    """Return the calendar year of a Unix timestamp (whole seconds)"""
+    return datetime.fromtimestamp(second).year